@@ -38,7 +38,7 @@ from fintran.core.exceptions import (
     WriterError,
 )
 from fintran.core.pipeline import execute_pipeline
-from fintran.core.schema import validate_ir
+from fintran.core.schema import REQUIRED_FIELDS, validate_ir
 
 
 def infer_reader(path: Path) -> str:
@@ -345,7 +345,6 @@ def validate(
             for col_name in ir.columns:
                 col_type = ir.schema[col_name]
                 # Mark required vs optional fields
-                from fintran.core.schema import REQUIRED_FIELDS
                 required_marker = " [REQUIRED]" if col_name in REQUIRED_FIELDS else " [OPTIONAL]"
                 print(f"  {col_name}: {col_type}{required_marker}")
         
@@ -555,6 +554,9 @@ def batch(
         # Filter to only include files (not directories)
         files = [f for f in files if f.is_file()]
         
+        # Process in path order so the order is deterministic across filesystems
+        files.sort()
+        
         if not files:
             print(f"No files matching pattern '{pattern}' in {input_dir}", file=sys.stderr)
             return ExitCode.UNEXPECTED_ERROR
@@ -26,14 +26,14 @@ Requirements:
 
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 try:
     import yaml
 except ImportError:
     yaml = None  # type: ignore
 
-from fintran.cli.registry import get_reader, get_writer, get_transform
+from fintran.cli.registry import check_component
 
 
 class ConfigError(Exception):
@@ -46,14 +46,51 @@ class ConfigError(Exception):
     pass
 
 
-def load_config(path: Path) -> dict[str, Any]:
-    """Load configuration from JSON or YAML file.
+def _read_source(source: Path | bytes | BinaryIO) -> tuple[bytes, str | None, str]:
+    """Read a config source into bytes.
+
+    Args:
+        source: Path to configuration file, raw config bytes, or a binary
+            file-like object
+
+    Returns:
+        Tuple of (content, suffix, label): the raw config bytes, the file
+        extension used to pick the format (None for in-memory sources), and a
+        name for the source in error messages
+
+    Raises:
+        ConfigError: If the file does not exist or cannot be read
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source), None, "<bytes>"
+
+    if hasattr(source, "read"):
+        label = getattr(source, "name", "<stream>")
+        try:
+            return source.read(), None, label
+        except Exception as e:
+            raise ConfigError(f"Failed to load config from {label}: {e}") from e
+
+    path = Path(source)
+    if not path.exists():
+        raise ConfigError(f"Configuration file not found: {path}")
+    try:
+        return path.read_bytes(), path.suffix, str(path)
+    except Exception as e:
+        raise ConfigError(f"Failed to load config from {path}: {e}") from e
+
+
+def load_config(source: Path | bytes | BinaryIO) -> dict[str, Any]:
+    """Load configuration from a JSON or YAML file, bytes, or binary stream.
     
-    Supports both JSON and YAML formats. Format is determined by file extension
-    (.json, .yaml, .yml) or auto-detected if extension is ambiguous.
+    Supports both JSON and YAML formats. For paths, the format is determined by
+    file extension (.json, .yaml, .yml) or auto-detected if the extension is
+    ambiguous. In-memory sources (bytes or a file-like object) are always
+    auto-detected, which avoids a filesystem round trip for generated configs.
     
     Args:
-        path: Path to configuration file
+        source: Path to configuration file, raw config bytes, or a binary
+            file-like object
         
     Returns:
         Configuration dictionary with keys like 'reader', 'writer', 'transforms',
@@ -69,6 +106,8 @@ def load_config(path: Path) -> dict[str, Any]:
         >>> config = load_config(Path("config.json"))
         >>> print(config["reader"])  # "csv"
         >>> print(config["writer"])  # "parquet"
+        >>> 
+        >>> config = load_config(b'{"reader": "csv"}')
         
     Requirements:
         - Requirement 3.1: Support JSON format
@@ -76,18 +115,15 @@ def load_config(path: Path) -> dict[str, Any]:
         - Requirement 3.5: Error for invalid path
         - Requirement 3.6: Error for invalid syntax
     """
-    if not path.exists():
-        raise ConfigError(f"Configuration file not found: {path}")
+    content, suffix, label = _read_source(source)
     
     try:
-        content = path.read_text()
-        
         # Try JSON first if extension suggests it
-        if path.suffix == ".json":
+        if suffix == ".json":
             return json.loads(content)
         
         # Try YAML if extension suggests it
-        elif path.suffix in (".yaml", ".yml"):
+        elif suffix in (".yaml", ".yml"):
             if yaml is None:
                 raise ConfigError(
                     f"YAML support not available. Install pyyaml to use YAML config files."
@@ -101,17 +137,17 @@ def load_config(path: Path) -> dict[str, Any]:
             except json.JSONDecodeError:
                 if yaml is None:
                     raise ConfigError(
-                        f"Could not parse {path} as JSON and YAML support not available. "
+                        f"Could not parse {label} as JSON and YAML support not available. "
                         f"Install pyyaml or use .json extension."
                     )
                 return yaml.safe_load(content)
                 
     except json.JSONDecodeError as e:
-        raise ConfigError(f"Invalid JSON in {path}: {e}")
+        raise ConfigError(f"Invalid JSON in {label}: {e}")
     except Exception as e:
         if yaml is not None and isinstance(e, yaml.YAMLError):
-            raise ConfigError(f"Invalid YAML in {path}: {e}")
-        raise ConfigError(f"Failed to load config from {path}: {e}")
+            raise ConfigError(f"Invalid YAML in {label}: {e}")
+        raise ConfigError(f"Failed to load config from {label}: {e}")
 
 
 def merge_config(
@@ -184,14 +220,14 @@ def validate_config(config: dict[str, Any]) -> list[str]:
     # Check reader exists
     if "reader" in config:
         try:
-            get_reader(config["reader"])
+            check_component("reader", config["reader"])
         except KeyError as e:
             errors.append(str(e))
     
     # Check writer exists
     if "writer" in config:
         try:
-            get_writer(config["writer"])
+            check_component("writer", config["writer"])
         except KeyError as e:
             errors.append(str(e))
     
@@ -199,7 +235,7 @@ def validate_config(config: dict[str, Any]) -> list[str]:
     if "transforms" in config:
         for transform in config["transforms"]:
             try:
-                get_transform(transform)
+                check_component("transform", transform)
             except KeyError as e:
                 errors.append(str(e))
     
@@ -23,6 +23,7 @@ Requirements:
     - Requirement 14.7: Display available transforms for invalid transform type
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 from fintran.core.protocols import Reader, Writer, Transform
@@ -33,6 +34,13 @@ READERS: dict[str, type[Reader]] = {}
 WRITERS: dict[str, type[Writer]] = {}
 TRANSFORMS: dict[str, type[Transform]] = {}
 
+# Registry dictionary for each component kind, used for name checks
+_REGISTRIES: Mapping[str, Mapping[str, type]] = {
+    "reader": READERS,
+    "writer": WRITERS,
+    "transform": TRANSFORMS,
+}
+
 
 def register_reader(name: str, cls: type[Reader]) -> None:
     """Register a reader implementation.
@@ -94,6 +102,59 @@ def register_transform(name: str, cls: type[Transform]) -> None:
     TRANSFORMS[name] = cls
 
 
+def register_components(
+    readers: Mapping[str, type[Reader]] | None = None,
+    writers: Mapping[str, type[Writer]] | None = None,
+    transforms: Mapping[str, type[Transform]] | None = None,
+) -> None:
+    """Register several readers, writers, and transforms in one call.
+    
+    Args:
+        readers: Mapping of reader names to reader classes (optional)
+        writers: Mapping of writer names to writer classes (optional)
+        transforms: Mapping of transform names to transform classes (optional)
+        
+    Example:
+        >>> from fintran.cli.registry import register_components
+        >>> 
+        >>> register_components(
+        ...     readers={"csv": CSVReader},
+        ...     writers={"parquet": ParquetWriter},
+        ... )
+    """
+    if readers:
+        READERS.update(readers)
+    if writers:
+        WRITERS.update(writers)
+    if transforms:
+        TRANSFORMS.update(transforms)
+
+
+def check_component(kind: str, name: str) -> None:
+    """Check that a component name is registered, without instantiating it.
+    
+    Args:
+        kind: Component kind ("reader", "writer", or "transform")
+        name: Name of the component to check
+        
+    Raises:
+        KeyError: If the name is not registered, with message listing the
+                 available components of that kind
+        ValueError: If kind is not a known component kind
+                 
+    Example:
+        >>> from fintran.cli.registry import check_component
+        >>> check_component("reader", "csv")
+    """
+    registry = _REGISTRIES.get(kind)
+    if registry is None:
+        kinds = ", ".join(_REGISTRIES)
+        raise ValueError(f"Unknown component kind '{kind}'. Expected one of: {kinds}")
+    if name not in registry:
+        available = ", ".join(sorted(registry.keys())) if registry else "none"
+        raise KeyError(f"Unknown {kind} '{name}'. Available: {available}")
+
+
 def get_reader(name: str) -> Reader:
     """Get reader instance by name.
     
@@ -112,9 +173,7 @@ def get_reader(name: str) -> Reader:
         >>> reader = get_reader("csv")
         >>> ir = reader.read(Path("input.csv"))
     """
-    if name not in READERS:
-        available = ", ".join(sorted(READERS.keys())) if READERS else "none"
-        raise KeyError(f"Unknown reader '{name}'. Available: {available}")
+    check_component("reader", name)
     return READERS[name]()
 
 
@@ -136,9 +195,7 @@ def get_writer(name: str) -> Writer:
         >>> writer = get_writer("parquet")
         >>> writer.write(ir, Path("output.parquet"))
     """
-    if name not in WRITERS:
-        available = ", ".join(sorted(WRITERS.keys())) if WRITERS else "none"
-        raise KeyError(f"Unknown writer '{name}'. Available: {available}")
+    check_component("writer", name)
     return WRITERS[name]()
 
 
@@ -160,9 +217,7 @@ def get_transform(name: str) -> Transform:
         >>> transform = get_transform("currency_normalizer")
         >>> ir = transform.transform(ir)
     """
-    if name not in TRANSFORMS:
-        available = ", ".join(sorted(TRANSFORMS.keys())) if TRANSFORMS else "none"
-        raise KeyError(f"Unknown transform '{name}'. Available: {available}")
+    check_component("transform", name)
     return TRANSFORMS[name]()
 
 
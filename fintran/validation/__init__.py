@@ -60,6 +60,7 @@ from fintran.validation.result import ValidationResult
 from fintran.validation.transform import (
     ValidatingTransform,
     attach_validation_report,
+    fork,
     get_validation_reports,
 )
 
@@ -75,6 +76,7 @@ __all__ = [
     "ValidatingTransform",
     "attach_validation_report",
     "get_validation_reports",
+    "fork",
     # Business rule validators
     "PositiveAmountsValidator",
     "CurrencyConsistencyValidator",
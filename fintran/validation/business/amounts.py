@@ -66,6 +66,11 @@ class PositiveAmountsValidator:
         # Compile regex patterns for efficiency
         self._compiled_patterns = [re.compile(pattern) for pattern in account_patterns]
 
+    @property
+    def required_columns(self) -> frozenset[str]:
+        """Columns read by this validator."""
+        return frozenset({"account", "amount"})
+
     def validate(self, df: pl.DataFrame) -> ValidationResult:
         """Check that amounts are positive for matching accounts.
 
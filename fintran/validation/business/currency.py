@@ -77,6 +77,11 @@ class CurrencyConsistencyValidator:
             self.group_by = group_by
             self._validate_whole_df = False
 
+    @property
+    def required_columns(self) -> frozenset[str]:
+        """Columns read by this validator."""
+        return frozenset(["currency", *(self.group_by or [])])
+
     def validate(self, df: pl.DataFrame) -> ValidationResult:
         """Check currency consistency within groups or across entire DataFrame.
 
@@ -81,6 +81,11 @@ class DateRangeValidator:
         self.min_date = min_date
         self.max_date = max_date
 
+    @property
+    def required_columns(self) -> frozenset[str]:
+        """Columns read by this validator."""
+        return frozenset({"date"})
+
     def validate(self, df: pl.DataFrame) -> ValidationResult:
         """Check that all transaction dates fall within the specified range.
 
@@ -37,6 +37,10 @@ class Validator(Protocol):
     with no side effects. The determinism requirement ensures that validation
     results are reproducible and testable.
 
+    Validators may optionally expose a ``required_columns`` frozenset naming the
+    columns they read. When every validator in a ValidatingTransform declares it,
+    only those columns are passed to the validation pipeline.
+
     Requirements:
         - Requirement 1.1: Define Validator protocol with validate method
         - Requirement 1.2: Support optional configuration parameters
@@ -66,6 +66,11 @@ class DuplicateDetectionValidator:
         self.fields = fields
         self.mode = mode
 
+    @property
+    def required_columns(self) -> frozenset[str]:
+        """Columns read by this validator."""
+        return frozenset(self.fields)
+
     def validate(self, df: pl.DataFrame) -> ValidationResult:
         """Detect duplicate rows based on specified fields.
 
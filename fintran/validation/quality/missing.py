@@ -55,6 +55,11 @@ class MissingValueDetectionValidator:
 
         self.fields = fields
 
+    @property
+    def required_columns(self) -> frozenset[str]:
+        """Columns read by this validator."""
+        return frozenset(self.fields)
+
     def validate(self, df: pl.DataFrame) -> ValidationResult:
         """Detect missing values and calculate percentages.
 
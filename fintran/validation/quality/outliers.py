@@ -76,6 +76,11 @@ class OutlierDetectionValidator:
         self.method = method
         self.threshold = threshold
 
+    @property
+    def required_columns(self) -> frozenset[str]:
+        """Columns read by this validator."""
+        return frozenset({"amount"})
+
     def validate(self, df: pl.DataFrame) -> ValidationResult:
         """Detect outlier amounts using the specified method.
 
@@ -1,14 +1,28 @@
 """ValidatingTransform for pipeline integration.
 
 This module defines the ValidatingTransform class that integrates validation into the fintran pipeline.
+
+Validation reports are kept in a module-level sidecar map keyed by DataFrame
+identity rather than on the DataFrame itself, since Polars DataFrames expose no
+stable user attributes. Entries are dropped when their DataFrame is garbage
+collected. Use fork() to give a pipeline branch its own copy of a DataFrame's
+validation history.
 """
 
+import weakref
+from collections import deque
+from collections.abc import Sequence
+
 import polars as pl
 
 from fintran.core.exceptions import ValidationError
 from fintran.validation.pipeline import ValidationPipeline
+from fintran.validation.protocols import Validator
 from fintran.validation.report import ValidationReport
 
+# Sidecar metadata store: id(df) -> {metadata_key: deque of report_data}
+_metadata_sidecar: dict[int, dict[str, deque[dict]]] = {}
+
 
 class ValidatingTransform:
     """Transform wrapper that runs validation and attaches results to IR metadata.
@@ -27,6 +41,7 @@ class ValidatingTransform:
         pipeline: ValidationPipeline to execute
         fail_on_error: If True, raise ValidationError on failures
         metadata_key: Key to use for storing report in IR metadata
+        history_limit: Number of most recent reports kept per metadata key
     
     Example:
         >>> from fintran.validation.pipeline import ValidationPipeline
@@ -40,6 +55,8 @@ class ValidatingTransform:
         >>> validated_df = transform.transform(ir_dataframe)
     """
     
+    history_limit: int = 16
+    
     def __init__(
         self,
         pipeline: ValidationPipeline,
@@ -80,8 +97,9 @@ class ValidatingTransform:
             ... except ValidationError as e:
             ...     print(f"Validation failed: {e}")
         """
-        # Run validation pipeline
-        report = self.pipeline.run(df)
+        # Run validation pipeline on just the columns the validators read; the
+        # report is still attached to the full DataFrame
+        report = self.pipeline.run(_project_validated_columns(df, self.pipeline.validators))
         
         # If fail_on_error is True and validation failed, raise error
         if self.fail_on_error and not report.is_valid():
@@ -90,21 +108,102 @@ class ValidatingTransform:
                 validation_report=report,
             )
         
-        # Attach report to metadata
-        df_with_metadata = attach_validation_report(df, report, self.metadata_key)
+        # Attach report to metadata of a new DataFrame instance (transforms
+        # must not return their input)
+        validated_df = fork(df)
+        _append_validation_report(validated_df, report, self.metadata_key, self.history_limit)
+        return validated_df
+
+
+def _project_validated_columns(
+    df: pl.DataFrame,
+    validators: Sequence[Validator],
+) -> pl.DataFrame:
+    """Select only the columns referenced by the validators' required_columns.
+    
+    Returns the DataFrame unchanged if any validator does not declare
+    required_columns, since it may read any column.
+    """
+    needed: set[str] = set()
+    for validator in validators:
+        columns = getattr(validator, "required_columns", None)
+        if columns is None:
+            return df
+        needed.update(columns)
+    
+    projected = [col for col in df.columns if col in needed]
+    if not projected or len(projected) == len(df.columns):
+        return df
+    return df.select(projected)
+
+
+def _sidecar_entry(df: pl.DataFrame) -> dict[str, deque[dict]]:
+    """Return the sidecar metadata for a DataFrame, creating it if needed."""
+    key = id(df)
+    entry = _metadata_sidecar.get(key)
+    if entry is None:
+        entry = _metadata_sidecar[key] = {}
+        weakref.finalize(df, _metadata_sidecar.pop, key, None)
+    return entry
+
+
+def fork(df: pl.DataFrame) -> pl.DataFrame:
+    """Return a new DataFrame instance carrying a copy of the validation metadata.
+    
+    The column buffers are shared with the input (Polars clones are shallow), so
+    this is cheap. Use it when a pipeline branch needs its own validation history.
+    
+    Args:
+        df: IR DataFrame to fork
+        
+    Returns:
+        New DataFrame instance with the same data and validation reports
         
-        return df_with_metadata
+    Example:
+        >>> branch = fork(df_with_metadata)
+        >>> branch is df_with_metadata
+        False
+    """
+    forked = df.clone()
+    
+    metadata = _metadata_sidecar.get(id(df))
+    if metadata:
+        entry = _sidecar_entry(forked)
+        for metadata_key, reports in metadata.items():
+            entry[metadata_key] = deque(reports, maxlen=reports.maxlen)
+    
+    return forked
+
+
+def _append_validation_report(
+    df: pl.DataFrame,
+    report: ValidationReport,
+    metadata_key: str,
+    history_limit: int,
+) -> None:
+    """Append a validation report to a DataFrame's history in place.
+    
+    The deque evicts the oldest report once history_limit is reached.
+    """
+    entry = _sidecar_entry(df)
+    reports = entry.get(metadata_key)
+    if reports is None:
+        reports = entry[metadata_key] = deque(maxlen=history_limit)
+    reports.append(report.to_json())
 
 
 def attach_validation_report(
     df: pl.DataFrame,
     report: ValidationReport,
     metadata_key: str = "validation_report",
+    history_limit: int | None = None,
 ) -> pl.DataFrame:
     """Attach validation report to IR DataFrame metadata.
     
-    Stores the ValidationReport in the DataFrame's metadata for later retrieval.
-    Supports multiple validation runs by storing reports in a list.
+    Stores the ValidationReport in the metadata of a new DataFrame for later
+    retrieval. Supports multiple validation runs by keeping the most recent
+    reports in a bounded history, oldest first. The input DataFrame and its
+    history are left unchanged.
     
     Requirements:
         - Requirement 22.1: Attach ValidationReport to IR metadata
@@ -115,6 +214,8 @@ def attach_validation_report(
         df: IR DataFrame to attach metadata to
         report: ValidationReport to attach
         metadata_key: Key to use for storing report
+        history_limit: Maximum number of reports kept for metadata_key
+            (defaults to ValidatingTransform.history_limit)
         
     Returns:
         New DataFrame with validation report in metadata
@@ -124,20 +225,12 @@ def attach_validation_report(
         >>> reports = get_validation_reports(df_with_metadata)
         >>> print(f"Found {len(reports)} validation reports")
     """
-    # Convert report to JSON for storage
-    report_data = report.to_json()
-    
-    # Get existing validation reports from the input DataFrame
-    existing_reports = get_validation_reports(df, metadata_key)
-    
-    # Append new report to existing reports
-    all_reports = existing_reports + [report_data]
-    
-    # Create new DataFrame (clone to avoid mutation)
-    df_with_metadata = df.clone()
+    if history_limit is None:
+        history_limit = ValidatingTransform.history_limit
     
-    # Store metadata as a custom attribute on the DataFrame
-    setattr(df_with_metadata, "_validation_metadata", {metadata_key: all_reports})
+    # Convert report to JSON and store it on a fork, so the input keeps its history
+    df_with_metadata = fork(df)
+    _append_validation_report(df_with_metadata, report, metadata_key, history_limit)
     
     return df_with_metadata
 
@@ -157,7 +250,7 @@ def get_validation_reports(
         metadata_key: Key used for storing reports
         
     Returns:
-        List of validation report dictionaries
+        List of validation report dictionaries, oldest first
         
     Example:
         >>> reports = get_validation_reports(df)
@@ -165,14 +258,8 @@ def get_validation_reports(
         ...     print(f"Timestamp: {report['timestamp']}")
         ...     print(f"Passed: {report['summary']['passed']}")
     """
-    # Try to get metadata from custom attribute
-    if hasattr(df, "_validation_metadata"):
-        metadata = getattr(df, "_validation_metadata")
-        return metadata.get(metadata_key, [])
-    
-    # Try to get from column metadata
-    try:
-        column_meta = df.get_column("date").meta
-        return column_meta.get(metadata_key, [])
-    except Exception:
+    # Single lookup in the sidecar store; _append_validation_report is the only writer
+    metadata = _metadata_sidecar.get(id(df))
+    if metadata is None:
         return []
+    return list(metadata.get(metadata_key, ()))
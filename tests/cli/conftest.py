@@ -0,0 +1,146 @@
+"""Shared fixtures for CLI tests.
+
+This module provides mock reader/writer components and registers them once
+per test module, so property tests don't re-register on every example.
+"""
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from fintran.cli.registry import READERS, WRITERS, register_components
+from tests.conftest import IR_DECIMAL
+
+# Simple valid IR DataFrame returned by every MockReader.read call
+MOCK_IR_DF = pl.DataFrame(
+    {
+        "date": [date(2024, 1, 1)],
+        "account": ["1000"],
+        "amount": [Decimal("100.00")],
+        "currency": ["EUR"],
+        "description": ["Test"],
+        "reference": ["REF1"],
+    },
+    schema_overrides={"amount": IR_DECIMAL},
+)
+
+# Formats served by the mock reader and writer
+MOCK_FORMATS = ("csv", "json", "parquet")
+
+
+class MockReader:
+    """Mock reader for testing."""
+
+    def read(self, path: Path, **config):
+        """Read file and return IR DataFrame."""
+        # Shared instance; pipeline steps return new DataFrames rather than mutating
+        return MOCK_IR_DF
+
+
+class MockWriter:
+    """Mock writer for testing."""
+
+    def write(self, df: pl.DataFrame, path: Path, **config):
+        """Write DataFrame to file."""
+        # Just create an empty file to simulate writing
+        path.write_text("mock output")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def setup_registry():
+    """Register mock components once per module (registration is idempotent).
+
+    The previous registry contents are restored afterwards, so modules stay
+    hermetic however a scheduler such as pytest-xdist interleaves them.
+    Test modules that need different components override this fixture by
+    defining their own setup_registry.
+    """
+    saved_readers, saved_writers = dict(READERS), dict(WRITERS)
+    register_components(
+        readers=dict.fromkeys(MOCK_FORMATS, MockReader),
+        writers=dict.fromkeys(MOCK_FORMATS, MockWriter),
+    )
+    yield
+    READERS.clear()
+    READERS.update(saved_readers)
+    WRITERS.clear()
+    WRITERS.update(saved_writers)
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """Module-wide temporary directory; tests derive unique paths per example."""
+    return tmp_path_factory.mktemp("cli_props")
+
+
+@pytest.fixture(scope="module")
+def stub_input(shared_tmp):
+    """Return a placeholder input file for a suffix, written once per module.
+
+    For tests that mock execute_pipeline, where the CLI only checks that the
+    input path exists and never reads it.
+    """
+    paths: dict[str, Path] = {}
+
+    def get(suffix: str = ".csv") -> Path:
+        path = paths.get(suffix)
+        if path is None:
+            path = paths[suffix] = shared_tmp / f"stub_input{suffix}"
+            path.write_text("test data")
+        return path
+
+    return get
+
+
+@pytest.fixture
+def output_file(tmp_path):
+    """Output path in the test's temporary directory, built once per test.
+
+    Hypothesis examples of a test share it; the mocked pipeline never creates it.
+    """
+    return tmp_path / "output.parquet"
+
+
+class PipelineStub:
+    """Minimal stand-in for execute_pipeline that records its last call.
+
+    Plain attributes instead of MagicMock keep the per-example cost of
+    property tests low.
+    """
+
+    __slots__ = ("args", "called", "kwargs", "return_value", "side_effect")
+
+    def __init__(self):
+        self.return_value = None
+        self.reset()
+
+    def reset(self):
+        """Forget recorded calls and any configured side effect."""
+        self.called = False
+        self.args = ()
+        self.kwargs = {}
+        self.side_effect = None
+
+    def __call__(self, *args, **kwargs):
+        """Record the call, then raise side_effect if set."""
+        self.called = True
+        self.args = args
+        self.kwargs = kwargs
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+@pytest.fixture
+def patched_pipeline(monkeypatch):
+    """Replace execute_pipeline in the CLI commands once for the whole test.
+
+    Under Hypothesis every example shares this stub, so tests reset it at the
+    start of each example.
+    """
+    stub = PipelineStub()
+    monkeypatch.setattr("fintran.cli.commands.execute_pipeline", stub)
+    return stub
@@ -11,15 +11,18 @@ This module tests universal properties of configuration file loading and merging
 Requirements: 3.1-3.6, 11.2, 11.5, 11.6, 15.6
 """
 
+import io
+import itertools
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
-from hypothesis import HealthCheck, given, settings
+from hypothesis import given
 from hypothesis import strategies as st
 
+from fintran.cli import registry
 from fintran.cli.config import ConfigError, load_config, merge_config, validate_config
-from fintran.cli.registry import register_reader, register_writer, register_transform
 
 
 class MockComponent:
@@ -27,59 +30,144 @@ class MockComponent:
     pass
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="module")
 def setup_registry():
-    """Register mock components for testing."""
-    register_reader("csv", MockComponent)
-    register_reader("json", MockComponent)
-    register_writer("parquet", MockComponent)
-    register_writer("csv", MockComponent)
-    register_transform("test_transform", MockComponent)
+    """Register mock components once for the module (registration is idempotent).
+    
+    Overrides the shared CLI fixture to also register a transform, and
+    restores the previous registry contents afterwards like that fixture does.
+    """
+    registries = (registry.READERS, registry.WRITERS, registry.TRANSFORMS)
+    saved = [(components, dict(components)) for components in registries]
+    registry.register_components(
+        readers=dict.fromkeys(("csv", "json"), MockComponent),
+        writers=dict.fromkeys(("parquet", "csv"), MockComponent),
+        transforms={"test_transform": MockComponent},
+    )
     yield
+    for components, contents in saved:
+        components.clear()
+        components.update(contents)
+
+
+@pytest.fixture(scope="module")
+def config_dir(tmp_path_factory):
+    """Module-wide directory for config files written by the tests."""
+    return tmp_path_factory.mktemp("config")
+
+
+_config_file_ids = itertools.count()
+
+
+def unique_path(directory: Path, suffix: str = ".json") -> Path:
+    """Return a not-yet-used file path in directory for one example."""
+    return directory / f"config_{next(_config_file_ids)}{suffix}"
+
+
+# Encoded config bodies keyed by a hashable snapshot of the config, so repeated
+# Hypothesis draws reuse the bytes instead of re-running json.dumps
+_encoded_configs: dict[Any, bytes] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable snapshot of a JSON-compatible value."""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    # Keep the type so equal-hashing scalars (1, 1.0, True) stay distinct
+    return (type(value), value)
+
+
+def encode_config(config: dict[str, Any], **dumps_kwargs: Any) -> bytes:
+    """Serialize a config dict to JSON bytes, memoized across examples."""
+    key = (_freeze(config), _freeze(dumps_kwargs))
+    encoded = _encoded_configs.get(key)
+    if encoded is None:
+        encoded = _encoded_configs[key] = json.dumps(config, **dumps_kwargs).encode()
+    return encoded
+
+
+# Loaded configs keyed by the same snapshot, shared by every test that loads one
+_loaded_configs: dict[Any, dict[str, Any]] = {}
+
+
+def load_encoded(config: dict[str, Any]) -> dict[str, Any]:
+    """Serialize a config and load it back through load_config, memoized.
+    
+    The returned dict is shared between callers and must not be mutated.
+    """
+    key = _freeze(config)
+    loaded = _loaded_configs.get(key)
+    if loaded is None:
+        json_stream = io.BytesIO(encode_config(config, separators=(",", ":")))
+        loaded = _loaded_configs[key] = load_config(json_stream)
+    return loaded
+
+
+# Leaf strategies shared by every valid_config_dict draw
+INCLUDE = st.booleans()
+READERS = st.sampled_from(["csv", "json"])
+WRITERS = st.sampled_from(["parquet", "csv"])
+NUM_TRANSFORMS = st.integers(min_value=0, max_value=3)
+OPTION1 = st.text(max_size=20)
+OPTION2 = st.integers(min_value=0, max_value=100)
+COMPRESSION = st.sampled_from(["snappy", "gzip", "none"])
+REQUIRED_KEY = st.sampled_from(
+    ["reader", "writer", "transforms", "reader_config", "writer_config"]
+)
+
+# Transform lists indexed by length; shared across draws since nothing mutates them
+TRANSFORM_LISTS = tuple(["test_transform"] * n for n in range(4))
 
 
 # Strategy for generating valid configuration dictionaries
 @st.composite
 def valid_config_dict(draw):
-    """Generate random valid configuration dictionaries."""
+    """Generate random valid, non-empty configuration dictionaries."""
     config = {}
     
+    # Always include one key so no draw is spent on an empty config
+    required = draw(REQUIRED_KEY)
+    
     # Optionally include reader
-    if draw(st.booleans()):
-        config["reader"] = draw(st.sampled_from(["csv", "json"]))
+    if required == "reader" or draw(INCLUDE):
+        config["reader"] = draw(READERS)
     
     # Optionally include writer
-    if draw(st.booleans()):
-        config["writer"] = draw(st.sampled_from(["parquet", "csv"]))
+    if required == "writer" or draw(INCLUDE):
+        config["writer"] = draw(WRITERS)
     
     # Optionally include transforms
-    if draw(st.booleans()):
-        num_transforms = draw(st.integers(min_value=0, max_value=3))
+    if required == "transforms" or draw(INCLUDE):
+        num_transforms = draw(NUM_TRANSFORMS)
+        if required == "transforms":
+            num_transforms = max(num_transforms, 1)
         if num_transforms > 0:
-            config["transforms"] = ["test_transform"] * num_transforms
+            config["transforms"] = TRANSFORM_LISTS[num_transforms]
     
     # Optionally include reader_config
-    if draw(st.booleans()):
+    if required == "reader_config" or draw(INCLUDE):
         config["reader_config"] = {
-            "option1": draw(st.text(max_size=20)),
-            "option2": draw(st.integers(min_value=0, max_value=100)),
+            "option1": draw(OPTION1),
+            "option2": draw(OPTION2),
         }
     
     # Optionally include writer_config
-    if draw(st.booleans()):
+    if required == "writer_config" or draw(INCLUDE):
         config["writer_config"] = {
-            "compression": draw(st.sampled_from(["snappy", "gzip", "none"])),
+            "compression": draw(COMPRESSION),
         }
     
     return config
 
 
 # Feature: cli-interface, Property 5: Configuration Round Trip
+@pytest.mark.property
 @given(
     config=valid_config_dict(),
 )
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_configuration_round_trip(config, tmp_path):
+def test_property_configuration_round_trip(config):
     """Test that configuration survives JSON serialization round trip.
     
     **Validates: Requirements 3.1, 3.2**
@@ -95,41 +183,22 @@ def test_property_configuration_round_trip(config, tmp_path):
     
     Args:
         config: Random valid configuration dictionary
-        tmp_path: Pytest temporary directory fixture
     """
-    # Skip empty configs
-    if not config:
-        return
-    
-    # Write config to JSON file
-    json_file = tmp_path / "config.json"
-    json_file.write_text(json.dumps(config, indent=2))
+    # Serialize config to JSON and load it back
+    loaded_config = load_encoded(config)
     
-    # Load config back
-    loaded_config = load_config(json_file)
-    
-    # Verify all keys are preserved
-    for key in config.keys():
-        assert key in loaded_config, (
-            f"Key '{key}' should be present in loaded config"
-        )
-        assert loaded_config[key] == config[key], (
-            f"Value for '{key}' should match: expected {config[key]}, got {loaded_config[key]}"
-        )
-    
-    # Verify no extra keys were added
-    for key in loaded_config.keys():
-        assert key in config, (
-            f"Unexpected key '{key}' in loaded config"
-        )
+    # Verify all keys and values are preserved, with no extra keys
+    assert loaded_config == config, (
+        f"Loaded config should match: expected {config}, got {loaded_config}"
+    )
 
 
 # Feature: cli-interface, Property 6: Configuration Loading
+@pytest.mark.property
 @given(
     config=valid_config_dict(),
 )
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_configuration_loading(config, tmp_path):
+def test_property_configuration_loading(config):
     """Test that all configuration settings are loaded correctly.
     
     **Validates: Requirements 3.3**
@@ -146,18 +215,9 @@ def test_property_configuration_loading(config, tmp_path):
     
     Args:
         config: Random valid configuration dictionary
-        tmp_path: Pytest temporary directory fixture
     """
-    # Skip empty configs
-    if not config:
-        return
-    
-    # Write config to file
-    config_file = tmp_path / "config.json"
-    config_file.write_text(json.dumps(config))
-    
-    # Load config
-    loaded = load_config(config_file)
+    # Load config from its serialized form
+    loaded = load_encoded(config)
     
     # Verify reader is present if specified
     if "reader" in config:
@@ -190,15 +250,28 @@ def test_property_configuration_loading(config, tmp_path):
         assert loaded["writer_config"] == config["writer_config"]
 
 
+# Every file/CLI reader and writer combination, with the merge it should produce
+PRECEDENCE_CASES = [
+    (
+        file_reader,
+        cli_reader,
+        file_writer,
+        cli_writer,
+        {"reader": cli_reader, "writer": cli_writer, "transforms": []},
+    )
+    for file_reader, cli_reader, file_writer, cli_writer in itertools.product(
+        ["csv", "json"], ["csv", "json"], ["parquet", "csv"], ["parquet", "csv"]
+    )
+]
+
+
 # Feature: cli-interface, Property 7: CLI Argument Precedence
-@given(
-    file_reader=st.sampled_from(["csv", "json"]),
-    cli_reader=st.sampled_from(["csv", "json"]),
-    file_writer=st.sampled_from(["parquet", "csv"]),
-    cli_writer=st.sampled_from(["parquet", "csv"]),
+@pytest.mark.parametrize(
+    "file_reader,cli_reader,file_writer,cli_writer,expected", PRECEDENCE_CASES
 )
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_cli_argument_precedence(file_reader, cli_reader, file_writer, cli_writer):
+def test_property_cli_argument_precedence(
+    file_reader, cli_reader, file_writer, cli_writer, expected
+):
     """Test that CLI arguments override configuration file values.
     
     **Validates: Requirements 3.4**
@@ -218,6 +291,7 @@ def test_property_cli_argument_precedence(file_reader, cli_reader, file_writer,
         cli_reader: Reader type from CLI argument
         file_writer: Writer type in config file
         cli_writer: Writer type from CLI argument
+        expected: Merged configuration the CLI values should produce
     """
     # Create base config from file
     file_config = {
@@ -226,123 +300,111 @@ def test_property_cli_argument_precedence(file_reader, cli_reader, file_writer,
         "transforms": ["test_transform"],
     }
     
-    # Merge with CLI arguments
+    # Merge with CLI arguments (empty transforms list to override)
     merged = merge_config(
         file_config,
         reader=cli_reader,
         writer=cli_writer,
-        transforms=[],  # Empty list to override
+        transforms=[],
     )
     
     # Verify CLI arguments took precedence
-    assert merged["reader"] == cli_reader, (
-        f"CLI reader '{cli_reader}' should override file reader '{file_reader}', "
-        f"got {merged['reader']}"
+    assert merged == expected, (
+        f"CLI arguments should override file config {file_config}, got {merged}"
     )
+
+
+@pytest.mark.parametrize("as_stream", [False, True])
+def test_load_config_in_memory_sources(as_stream):
+    """Test that configs load from raw bytes and from binary streams.
     
-    assert merged["writer"] == cli_writer, (
-        f"CLI writer '{cli_writer}' should override file writer '{file_writer}', "
-        f"got {merged['writer']}"
-    )
+    **Validates: Requirements 3.1, 3.3**
     
-    assert merged["transforms"] == [], (
-        f"CLI transforms [] should override file transforms, got {merged['transforms']}"
-    )
+    Args:
+        as_stream: Whether to wrap the encoded config in a BytesIO
+    """
+    config = {"reader": "csv", "transforms": ["test_transform"]}
+    encoded = encode_config(config)
+    
+    loaded = load_config(io.BytesIO(encoded) if as_stream else encoded)
+    
+    assert loaded == config, f"Expected {config}, got {loaded}"
 
 
 # Feature: cli-interface, Property 8: Invalid Configuration Detection
-@given(
-    invalid_type=st.sampled_from([
-        "missing_file",
-        "invalid_json",
-        "invalid_reader",
-        "invalid_writer",
-        "invalid_transform",
-    ]),
-)
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_invalid_configuration_detection(invalid_type, tmp_path):
-    """Test that invalid configurations are detected and reported.
-    
+@pytest.mark.parametrize("invalid_type", ["missing_file", "invalid_json"])
+def test_property_invalid_configuration_detection(invalid_type, config_dir):
+    """Test that invalid configuration files are detected and reported.
+
     **Validates: Requirements 3.5, 3.6, 11.4**
-    
+
     Property: For any configuration file with invalid syntax or non-existent file
     path, the CLI should detect the error and raise ConfigError.
-    
+
     This property verifies that:
     - Missing files are detected
     - Invalid JSON syntax is detected
-    - Invalid component references are detected
     - Appropriate error messages are provided
-    
+
     Args:
         invalid_type: Type of invalid configuration to test
-        tmp_path: Pytest temporary directory fixture
+        config_dir: Module-scoped directory for config files
     """
     if invalid_type == "missing_file":
         # Test missing file
-        missing_file = tmp_path / "nonexistent.json"
-        
+        missing_file = unique_path(config_dir)
+
         with pytest.raises(ConfigError) as exc_info:
             load_config(missing_file)
-        
+
         assert "not found" in str(exc_info.value).lower(), (
             f"Error message should mention 'not found', got: {exc_info.value}"
         )
-    
+
     elif invalid_type == "invalid_json":
         # Test invalid JSON syntax
-        invalid_file = tmp_path / "invalid.json"
-        invalid_file.write_text("{invalid json syntax")
-        
+        invalid_file = unique_path(config_dir)
+        invalid_file.write_bytes(b"{invalid json syntax")
+
         with pytest.raises(ConfigError) as exc_info:
             load_config(invalid_file)
-        
+
         assert "json" in str(exc_info.value).lower() or "invalid" in str(exc_info.value).lower(), (
             f"Error message should mention JSON or invalid, got: {exc_info.value}"
         )
-    
-    elif invalid_type == "invalid_reader":
-        # Test invalid reader reference
-        config = {"reader": "nonexistent_reader"}
-        errors = validate_config(config)
-        
-        assert len(errors) > 0, "Should detect invalid reader"
-        assert any("reader" in err.lower() for err in errors), (
-            f"Error should mention reader, got: {errors}"
-        )
-    
-    elif invalid_type == "invalid_writer":
-        # Test invalid writer reference
-        config = {"writer": "nonexistent_writer"}
-        errors = validate_config(config)
-        
-        assert len(errors) > 0, "Should detect invalid writer"
-        assert any("writer" in err.lower() for err in errors), (
-            f"Error should mention writer, got: {errors}"
-        )
-    
-    elif invalid_type == "invalid_transform":
-        # Test invalid transform reference
-        config = {"transforms": ["nonexistent_transform"]}
-        errors = validate_config(config)
-        
-        assert len(errors) > 0, "Should detect invalid transform"
-        assert any("transform" in err.lower() for err in errors), (
-            f"Error should mention transform, got: {errors}"
-        )
+
+
+@pytest.mark.parametrize(
+    "field,value,needle",
+    [
+        ("reader", "nonexistent_reader", "reader"),
+        ("writer", "nonexistent_writer", "writer"),
+        ("transforms", ["nonexistent_transform"], "transform"),
+    ],
+)
+def test_validate_bad_components(field, value, needle):
+    """Test that a reference to an unregistered component is reported.
+
+    **Validates: Requirements 11.4**
+
+    Args:
+        field: Configuration key holding the component reference
+        value: Reference to a component that is not registered
+        needle: Text the error message should mention
+    """
+    errors = validate_config({field: value})
+
+    assert len(errors) > 0, f"Should detect invalid {needle}"
+    assert any(needle in err.lower() for err in errors), (
+        f"Error should mention {needle}, got: {errors}"
+    )
 
 
 # Feature: cli-interface, Property 17: Configuration Validation
-@given(
-    has_reader=st.booleans(),
-    has_writer=st.booleans(),
-    has_transforms=st.booleans(),
-    reader_valid=st.booleans(),
-    writer_valid=st.booleans(),
-    transforms_valid=st.booleans(),
+@pytest.mark.parametrize(
+    "has_reader,has_writer,has_transforms,reader_valid,writer_valid,transforms_valid",
+    list(itertools.product([False, True], repeat=6)),
 )
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_configuration_validation(
     has_reader, has_writer, has_transforms,
     reader_valid, writer_valid, transforms_valid
@@ -411,11 +473,11 @@ def test_property_configuration_validation(
 
 
 # Feature: cli-interface, Property 25: Configuration Parameter Passing
+@pytest.mark.property
 @given(
     config=valid_config_dict(),
 )
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_configuration_parameter_passing(config, tmp_path):
+def test_property_configuration_parameter_passing(config):
     """Test that configuration parameters are preserved for pipeline use.
     
     **Validates: Requirements 15.6**
@@ -432,18 +494,13 @@ def test_property_configuration_parameter_passing(config, tmp_path):
     
     Args:
         config: Random valid configuration dictionary
-        tmp_path: Pytest temporary directory fixture
     """
     # Skip if no config parameters
     if not any(k in config for k in ["reader_config", "writer_config", "pipeline_config"]):
         return
     
-    # Write config to file
-    config_file = tmp_path / "config.json"
-    config_file.write_text(json.dumps(config))
-    
     # Load and merge config (simulating CLI flow)
-    loaded = load_config(config_file)
+    loaded = load_encoded(config)
     merged = merge_config(loaded)
     
     # Verify reader_config is preserved
@@ -8,56 +8,23 @@ This module tests universal properties of CLI output including:
 Requirements: 7.6, 7.7, 8.1-8.5
 """
 
-from pathlib import Path
-from unittest.mock import Mock, patch
+import re
 
 import pytest
-from hypothesis import HealthCheck, given, settings
-from hypothesis import strategies as st
 
 from fintran.cli.commands import convert
 from fintran.cli.exit_codes import ExitCode
-from fintran.cli.registry import register_reader, register_writer
+from fintran.core.exceptions import ReaderError, WriterError
 
-
-class MockReader:
-    """Mock reader for testing."""
-    
-    def read(self, path: Path, **config):
-        """Read file and return IR DataFrame."""
-        import polars as pl
-        return pl.DataFrame({
-            "date": [pl.date(2024, 1, 1)],
-            "account": ["1000"],
-            "amount": [pl.Decimal("100.00", precision=38, scale=10)],
-            "currency": ["EUR"],
-            "description": ["Test"],
-            "reference": ["REF1"],
-        })
-
-
-class MockWriter:
-    """Mock writer for testing."""
-    
-    def write(self, df, path: Path, **config):
-        """Write DataFrame to file."""
-        path.write_text("mock output")
-
-
-@pytest.fixture(autouse=True)
-def setup_registry():
-    """Register mock components for testing."""
-    register_reader("csv", MockReader)
-    register_writer("parquet", MockWriter)
-    yield
+# Common progress indicators, matched case-insensitively in one pass per stream
+PROGRESS_INDICATORS = re.compile("converting|success|✓|complete", re.IGNORECASE)
 
 
 # Feature: cli-interface, Property 15: Progress Indicator Visibility
-@given(
-    quiet_mode=st.booleans(),
-)
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_progress_indicator_visibility(quiet_mode, tmp_path, capsys):
+@pytest.mark.parametrize("quiet_mode", [True, False])
+def test_property_progress_indicator_visibility(
+    quiet_mode, stub_input, output_file, capsys, patched_pipeline
+):
     """Test that progress indicators are shown when appropriate.
     
     **Validates: Requirements 8.1, 8.2, 6.6**
@@ -73,57 +40,53 @@ def test_property_progress_indicator_visibility(quiet_mode, tmp_path, capsys):
     
     Args:
         quiet_mode: Whether quiet mode is enabled
-        tmp_path: Pytest temporary directory fixture
+        stub_input: Fixture returning a placeholder input file per suffix
+        output_file: Output path in the test's temporary directory
         capsys: Pytest fixture to capture stdout/stderr
+        patched_pipeline: execute_pipeline stub for this test
     """
-    # Create test files
-    input_file = tmp_path / "input.csv"
-    output_file = tmp_path / "output.parquet"
-    input_file.write_text("test data")
-    
-    # Mock execute_pipeline
-    with patch("fintran.cli.commands.execute_pipeline"):
-        # Execute convert
-        exit_code = convert(
-            input_path=input_file,
-            output_path=output_file,
-            reader="csv",
-            writer="parquet",
-            quiet=quiet_mode,
+    # Create test files (input only has to exist, since execute_pipeline is mocked)
+    input_file = stub_input()
+    
+    # Execute convert
+    exit_code = convert(
+        input_path=input_file,
+        output_path=output_file,
+        reader="csv",
+        writer="parquet",
+        quiet=quiet_mode,
+    )
+    
+    assert exit_code == ExitCode.SUCCESS
+    
+    # Capture output
+    captured = capsys.readouterr()
+    
+    if quiet_mode:
+        # In quiet mode, there should be minimal or no progress output
+        # (though final results may still be shown)
+        # We can't be too strict here because some output is expected
+        pass
+    else:
+        # In normal mode, there should be some output indicating progress
+        # Look for common progress indicators
+        has_progress = bool(
+            PROGRESS_INDICATORS.search(captured.out)
+            or PROGRESS_INDICATORS.search(captured.err)
         )
         
-        assert exit_code == ExitCode.SUCCESS
-        
-        # Capture output
-        captured = capsys.readouterr()
-        combined_output = captured.out + captured.err
-        
-        if quiet_mode:
-            # In quiet mode, there should be minimal or no progress output
-            # (though final results may still be shown)
-            # We can't be too strict here because some output is expected
-            pass
-        else:
-            # In normal mode, there should be some output indicating progress
-            # Look for common progress indicators
-            has_progress = any(
-                indicator in combined_output.lower()
-                for indicator in ["converting", "success", "✓", "complete"]
-            )
-            
-            # Note: TTY detection may prevent progress indicators in test environment
-            # So we check if there's ANY output, not specifically progress indicators
-            assert combined_output or has_progress, (
-                f"Expected some output in non-quiet mode, got: {combined_output}"
-            )
+        # Note: TTY detection may prevent progress indicators in test environment
+        # So we check if there's ANY output, not specifically progress indicators
+        assert captured.out or captured.err or has_progress, (
+            f"Expected some output in non-quiet mode, got: {captured.out!r} / {captured.err!r}"
+        )
 
 
 # Feature: cli-interface, Property 16: Quiet Mode Suppression
-@given(
-    operation_type=st.sampled_from(["success", "error"]),
-)
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_quiet_mode_suppression(operation_type, tmp_path, capsys):
+@pytest.mark.parametrize("operation_type", ["success", "error"])
+def test_property_quiet_mode_suppression(
+    operation_type, stub_input, output_file, capsys, patched_pipeline
+):
     """Test that quiet mode suppresses progress but not results/errors.
     
     **Validates: Requirements 8.3, 8.4**
@@ -139,71 +102,63 @@ def test_property_quiet_mode_suppression(operation_type, tmp_path, capsys):
     
     Args:
         operation_type: Whether operation succeeds or fails
-        tmp_path: Pytest temporary directory fixture
+        stub_input: Fixture returning a placeholder input file per suffix
+        output_file: Output path in the test's temporary directory
         capsys: Pytest fixture to capture stdout/stderr
+        patched_pipeline: execute_pipeline stub for this test
     """
-    # Create test files
-    input_file = tmp_path / "input.csv"
-    output_file = tmp_path / "output.parquet"
-    input_file.write_text("test data")
+    # Create test files (input only has to exist, since execute_pipeline is mocked)
+    input_file = stub_input()
     
     if operation_type == "success":
         # Mock successful execution
-        with patch("fintran.cli.commands.execute_pipeline"):
-            exit_code = convert(
-                input_path=input_file,
-                output_path=output_file,
-                reader="csv",
-                writer="parquet",
-                quiet=True,
-            )
-            
-            assert exit_code == ExitCode.SUCCESS
-            
-            # Capture output
-            captured = capsys.readouterr()
-            combined_output = captured.out + captured.err
-            
-            # In quiet mode with success, there may be minimal output
-            # The key is that progress indicators are suppressed
-            # We can't test for specific output format, but we verify
-            # that the operation completed successfully
-            
+        exit_code = convert(
+            input_path=input_file,
+            output_path=output_file,
+            reader="csv",
+            writer="parquet",
+            quiet=True,
+        )
+        
+        assert exit_code == ExitCode.SUCCESS
+        
+        # In quiet mode with success, there may be minimal output
+        # The key is that progress indicators are suppressed
+        # We can't test for specific output format, but we verify
+        # that the operation completed successfully
+        
     else:  # error
         # Mock failed execution
-        with patch("fintran.cli.commands.execute_pipeline") as mock_pipeline:
-            from fintran.core.exceptions import ReaderError
-            mock_pipeline.side_effect = ReaderError("Test error")
-            
-            exit_code = convert(
-                input_path=input_file,
-                output_path=output_file,
-                reader="csv",
-                writer="parquet",
-                quiet=True,
-            )
-            
-            assert exit_code != ExitCode.SUCCESS
-            
-            # Capture output
-            captured = capsys.readouterr()
-            
-            # Even in quiet mode, errors should be displayed
-            assert captured.err, (
-                "Errors should be displayed even in quiet mode"
-            )
-            
-            assert "error" in captured.err.lower(), (
-                f"Error message should be present in quiet mode, got: {captured.err}"
-            )
+        patched_pipeline.side_effect = ReaderError("Test error")
+        
+        exit_code = convert(
+            input_path=input_file,
+            output_path=output_file,
+            reader="csv",
+            writer="parquet",
+            quiet=True,
+        )
+        
+        assert exit_code != ExitCode.SUCCESS
+        
+        # Capture output
+        captured = capsys.readouterr()
+        
+        # Even in quiet mode, errors should be displayed
+        assert captured.err, (
+            "Errors should be displayed even in quiet mode"
+        )
+        
+        assert "error" in captured.err.lower(), (
+            f"Error message should be present in quiet mode, got: {captured.err}"
+        )
 
 
 # Additional test for stream separation (already covered in error_handling but good to have here too)
-@given(
-    has_error=st.booleans(),
-)
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_output_stream_separation(has_error, tmp_path, capsys):
+@pytest.mark.parametrize("has_error", [True, False])
+def test_property_output_stream_separation(
+    has_error, stub_input, output_file, capsys, patched_pipeline
+):
     """Test that normal output and errors use separate streams.
     
     **Validates: Requirements 7.6, 7.7**
@@ -219,55 +174,52 @@ def test_property_output_stream_separation(has_error, tmp_path, capsys):
     
     Args:
         has_error: Whether the operation should produce an error
-        tmp_path: Pytest temporary directory fixture
+        stub_input: Fixture returning a placeholder input file per suffix
+        output_file: Output path in the test's temporary directory
         capsys: Pytest fixture to capture stdout/stderr
+        patched_pipeline: execute_pipeline stub for this test
     """
-    # Create test files
-    input_file = tmp_path / "input.csv"
-    output_file = tmp_path / "output.parquet"
-    input_file.write_text("test data")
+    # Create test files (input only has to exist, since execute_pipeline is mocked)
+    input_file = stub_input()
     
     if has_error:
         # Mock error execution
-        with patch("fintran.cli.commands.execute_pipeline") as mock_pipeline:
-            from fintran.core.exceptions import WriterError
-            mock_pipeline.side_effect = WriterError("Test write error")
-            
-            exit_code = convert(
-                input_path=input_file,
-                output_path=output_file,
-                reader="csv",
-                writer="parquet",
-            )
-            
-            assert exit_code == ExitCode.WRITER_ERROR
-            
-            # Capture output
-            captured = capsys.readouterr()
-            
-            # Errors must be on stderr
-            assert captured.err, "Error output should be on stderr"
-            assert "error" in captured.err.lower(), (
-                f"stderr should contain error message, got: {captured.err}"
-            )
-            
+        patched_pipeline.side_effect = WriterError("Test write error")
+        
+        exit_code = convert(
+            input_path=input_file,
+            output_path=output_file,
+            reader="csv",
+            writer="parquet",
+        )
+        
+        assert exit_code == ExitCode.WRITER_ERROR
+        
+        # Capture output
+        captured = capsys.readouterr()
+        
+        # Errors must be on stderr
+        assert captured.err, "Error output should be on stderr"
+        assert "error" in captured.err.lower(), (
+            f"stderr should contain error message, got: {captured.err}"
+        )
+        
     else:
         # Mock successful execution
-        with patch("fintran.cli.commands.execute_pipeline"):
-            exit_code = convert(
-                input_path=input_file,
-                output_path=output_file,
-                reader="csv",
-                writer="parquet",
+        exit_code = convert(
+            input_path=input_file,
+            output_path=output_file,
+            reader="csv",
+            writer="parquet",
+        )
+        
+        assert exit_code == ExitCode.SUCCESS
+        
+        # Capture output
+        captured = capsys.readouterr()
+        
+        # Success output should not contain error messages
+        if captured.out:
+            assert "error" not in captured.out.lower(), (
+                f"stdout should not contain error messages, got: {captured.out}"
             )
-            
-            assert exit_code == ExitCode.SUCCESS
-            
-            # Capture output
-            captured = capsys.readouterr()
-            
-            # Success output should not contain error messages
-            if captured.out:
-                assert "error" not in captured.out.lower(), (
-                    f"stdout should not contain error messages, got: {captured.out}"
-                )
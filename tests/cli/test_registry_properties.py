@@ -6,37 +6,68 @@ This module tests universal properties of the component registry including:
 Requirements: 14.5, 14.6, 14.7
 """
 
+import re
+
 import pytest
-from hypothesis import HealthCheck, given, settings
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from fintran.cli.registry import (
+    READERS,
+    TRANSFORMS,
+    WRITERS,
+    check_component,
     get_reader,
     get_transform,
     get_writer,
+    register_components,
     register_reader,
-    register_transform,
-    register_writer,
 )
 
+# Registered names per component type, as set up by setup_registry
+VALID_NAMES = {
+    "reader": ("csv", "json"),
+    "writer": ("parquet", "csv"),
+    "transform": ("test_transform",),
+}
+
+# Upper- and title-case variants of registered names, paired with the original
+CASE_VARIANTS = [
+    ("CSV", "csv"),
+    ("Csv", "csv"),
+    ("JSON", "json"),
+    ("Json", "json"),
+    ("PARQUET", "parquet"),
+    ("Parquet", "parquet"),
+]
+
 
 class MockComponent:
     """Mock component for testing."""
     pass
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="module")
 def setup_registry():
-    """Register mock components for testing."""
-    register_reader("csv", MockComponent)
-    register_reader("json", MockComponent)
-    register_writer("parquet", MockComponent)
-    register_writer("csv", MockComponent)
-    register_transform("test_transform", MockComponent)
+    """Register mock components once for the module (registration is idempotent).
+    
+    Overrides the shared CLI fixture to also register a transform, and
+    restores the previous registry contents afterwards like that fixture does.
+    """
+    saved = [(components, dict(components)) for components in (READERS, WRITERS, TRANSFORMS)]
+    register_components(
+        readers=dict.fromkeys(VALID_NAMES["reader"], MockComponent),
+        writers=dict.fromkeys(VALID_NAMES["writer"], MockComponent),
+        transforms=dict.fromkeys(VALID_NAMES["transform"], MockComponent),
+    )
     yield
+    for components, contents in saved:
+        components.clear()
+        components.update(contents)
 
 
 # Feature: cli-interface, Property 23: Invalid Component Type Handling
+@pytest.mark.property
 @given(
     component_type=st.sampled_from(["reader", "writer", "transform"]),
     invalid_name=st.text(
@@ -48,7 +79,7 @@ def setup_registry():
         max_size=30,
     ).filter(lambda x: x not in ["csv", "json", "parquet", "test_transform"]),
 )
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@settings(max_examples=50)
 def test_property_invalid_component_type_handling(component_type, invalid_name):
     """Test that invalid component types display available types and raise errors.
     
@@ -91,10 +122,11 @@ def test_property_invalid_component_type_handling(component_type, invalid_name):
 
 
 # Additional test for valid component retrieval
+@pytest.mark.property
 @given(
     component_type=st.sampled_from(["reader", "writer", "transform"]),
 )
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@settings(max_examples=50)
 def test_property_valid_component_retrieval(component_type):
     """Test that valid component types can be retrieved successfully.
     
@@ -111,14 +143,7 @@ def test_property_valid_component_retrieval(component_type):
     Args:
         component_type: Type of component (reader, writer, transform)
     """
-    # Map component types to valid names
-    valid_names = {
-        "reader": ["csv", "json"],
-        "writer": ["parquet", "csv"],
-        "transform": ["test_transform"],
-    }
-    
-    valid_name = valid_names[component_type][0]
+    valid_name = VALID_NAMES[component_type][0]
     
     # Try to get the valid component
     try:
@@ -139,12 +164,8 @@ def test_property_valid_component_retrieval(component_type):
 
 
 # Test for case sensitivity
-@given(
-    valid_name=st.sampled_from(["csv", "json", "parquet"]),
-    case_variant=st.sampled_from(["upper", "mixed", "title"]),
-)
-@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_component_name_case_sensitivity(valid_name, case_variant):
+@pytest.mark.parametrize("modified_name,valid_name", CASE_VARIANTS)
+def test_property_component_name_case_sensitivity(modified_name, valid_name):
     """Test that component names are case-sensitive.
     
     Property: Component names should be case-sensitive, meaning "CSV" is different
@@ -156,21 +177,9 @@ def test_property_component_name_case_sensitivity(valid_name, case_variant):
     - Users must use the correct case
     
     Args:
-        valid_name: A valid component name in lowercase
-        case_variant: How to modify the case
+        modified_name: Case variant of a registered name
+        valid_name: The registered name in lowercase
     """
-    # Modify the case
-    if case_variant == "upper":
-        modified_name = valid_name.upper()
-    elif case_variant == "mixed":
-        modified_name = valid_name[0].upper() + valid_name[1:] if len(valid_name) > 1 else valid_name.upper()
-    else:  # title
-        modified_name = valid_name.title()
-    
-    # Skip if the modified name is the same as original
-    if modified_name == valid_name:
-        return
-    
     # Try to get component with modified case
     # Should raise KeyError if case-sensitive (which is expected)
     with pytest.raises(KeyError):
@@ -199,3 +208,57 @@ def test_property_empty_component_name():
     
     with pytest.raises(KeyError):
         get_transform("")
+
+
+# Test that name checks do not instantiate components
+def test_check_component_does_not_instantiate():
+    """Test that check_component validates names without building components.
+    
+    This verifies that:
+    - Registered names pass without calling the component class
+    - Unknown names raise KeyError listing the available components
+    """
+    class ExplodingComponent:
+        """Component that fails if instantiated."""
+        def __init__(self):
+            raise AssertionError("check_component should not instantiate")
+    
+    register_reader("exploding", ExplodingComponent)
+    try:
+        check_component("reader", "exploding")
+    finally:
+        READERS.pop("exploding")
+    
+    with pytest.raises(KeyError, match=r"Available: .*csv"):
+        check_component("writer", "nonexistent_writer")
+
+
+def test_check_component_rejects_unknown_kind():
+    """Test that an unknown component kind is a ValueError, not a missing name."""
+    with pytest.raises(ValueError, match=re.escape("Unknown component kind 'loader'")):
+        check_component("loader", "csv")
+
+
+# Test for bulk registration
+def test_register_components_registers_all_kinds():
+    """Test that register_components registers readers, writers and transforms.
+    
+    This verifies that:
+    - Omitted kinds are left untouched
+    - Every mapping passed in is added to its registry
+    
+    setup_registry restores the registries after the module.
+    """
+    writers_before, transforms_before = dict(WRITERS), dict(TRANSFORMS)
+    register_components(readers={"bulk_reader": MockComponent})
+    assert "bulk_reader" in READERS
+    assert WRITERS == writers_before
+    assert TRANSFORMS == transforms_before
+    
+    register_components(
+        writers={"bulk_writer": MockComponent},
+        transforms={"bulk_transform": MockComponent},
+    )
+    assert isinstance(get_reader("bulk_reader"), MockComponent)
+    assert isinstance(get_writer("bulk_writer"), MockComponent)
+    assert isinstance(get_transform("bulk_transform"), MockComponent)
@@ -1,19 +1,111 @@
 """Shared test fixtures and Hypothesis strategies for fintran tests."""
 
+import os
 from datetime import date
 from decimal import Decimal as PyDecimal
 
 import polars as pl
+from hypothesis import HealthCheck, settings
 from hypothesis import strategies as st
+from hypothesis.database import DirectoryBasedExampleDatabase
 from hypothesis.strategies import composite
 
+# Default Hypothesis profile: small example budget and no example database, so
+# CI runs stay cheap; select another profile with HYPOTHESIS_PROFILE
+settings.register_profile(
+    "fast",
+    max_examples=20,
+    database=None,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+# CI profile: same budget, but keeps an example database so a cached directory
+# (HYPOTHESIS_DATABASE_DIR) lets later runs replay known failures first
+settings.register_profile(
+    "ci",
+    parent=settings.get_profile("fast"),
+    database=DirectoryBasedExampleDatabase(
+        os.getenv("HYPOTHESIS_DATABASE_DIR", ".hypothesis/examples")
+    ),
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "fast"))
+
+# Decimal dtype of IR amounts, shared so tests don't rebuild it per example
+IR_DECIMAL = pl.Decimal(precision=38, scale=10)
+
+# Concrete IR dtypes used to build generated DataFrames in a single pass
+_IR_TEST_SCHEMA = {
+    "date": pl.Date,
+    "account": pl.Utf8,
+    "amount": IR_DECIMAL,
+    "currency": pl.Utf8,
+    "description": pl.Utf8,
+    "reference": pl.Utf8,
+}
+
+# Empty IR DataFrame with the test dtypes, built once at import
+_EMPTY_IR_DF = pl.DataFrame(schema=_IR_TEST_SCHEMA)
+
+
+def _cents_to_decimal(cents: int) -> PyDecimal:
+    """Convert an integer number of cents to a 2-place Decimal amount.
+
+    Drawing integers and scaling is much cheaper for Hypothesis than
+    st.decimals with a places constraint.
+    """
+    return PyDecimal(cents).scaleb(-2)
+
+
+# Per-value strategies for each IR column, in _IR_TEST_SCHEMA order, built once at import
+_IR_COLUMN_ELEMENTS = (
+    # Dates within a reasonable range
+    st.dates(min_value=date(2020, 1, 1), max_value=date(2025, 12, 31)),
+    # Account strings (1-20 chars)
+    st.text(
+        alphabet=st.characters(
+            whitelist_categories=("Lu", "Ll", "Nd"),
+            whitelist_characters="-_",
+        ),
+        min_size=1,
+        max_size=20,
+    ),
+    # Decimal amounts (2 decimal places, no NaN/infinity) from integer cents
+    st.integers(min_value=-99_999_999_999, max_value=99_999_999_999).map(_cents_to_decimal),
+    # Currency codes
+    st.sampled_from(["USD", "EUR", "GBP", "JPY"]),
+    # Optional descriptions
+    st.one_of(
+        st.none(),
+        st.text(
+            alphabet=st.characters(
+                whitelist_categories=("Lu", "Ll", "Nd", "Zs"),
+                whitelist_characters=".,;:-_",
+            ),
+            max_size=100,
+        ),
+    ),
+    # Optional references
+    st.one_of(
+        st.none(),
+        st.text(
+            alphabet=st.characters(
+                whitelist_categories=("Lu", "Ll", "Nd"),
+                whitelist_characters="-_",
+            ),
+            max_size=50,
+        ),
+    ),
+)
+
 
 @composite
-def valid_ir_dataframe(draw: st.DrawFn) -> pl.DataFrame:
+def valid_ir_dataframe(
+    draw: st.DrawFn, min_rows: int = 0, max_rows: int = 20
+) -> pl.DataFrame:
     """Generate random valid IR DataFrames for property-based testing.
 
     This strategy generates DataFrames that conform to the IR schema with:
-    - Random size between 0 and 20 rows
+    - Random size between min_rows and max_rows rows
     - date: Valid dates
     - account: Non-empty text strings (1-20 chars)
     - amount: Decimal values with 2 decimal places (no NaN/infinity)
@@ -21,6 +113,11 @@ def valid_ir_dataframe(draw: st.DrawFn) -> pl.DataFrame:
     - description: Optional text (can be None)
     - reference: Optional text (can be None)
 
+    Args:
+        draw: Hypothesis draw function
+        min_rows: Minimum number of rows (default: 0)
+        max_rows: Maximum number of rows (default: 20)
+
     Returns:
         Valid IR DataFrame with random data
 
@@ -30,134 +127,43 @@ def valid_ir_dataframe(draw: st.DrawFn) -> pl.DataFrame:
         ... def test_something(df):
         ...     assert len(df.columns) == 6
     """
-    # Generate random size between 0 and 20 rows
-    size = draw(st.integers(min_value=0, max_value=20))
+    # Generate random size between min_rows and max_rows
+    size = draw(st.integers(min_value=min_rows, max_value=max_rows))
 
     if size == 0:
-        # Return empty IR DataFrame
-        return pl.DataFrame(
-            {
-                "date": [],
-                "account": [],
-                "amount": [],
-                "currency": [],
-                "description": [],
-                "reference": [],
-            },
-            schema={
-                "date": pl.Date,
-                "account": pl.Utf8,
-                "amount": pl.Decimal(precision=38, scale=10),
-                "currency": pl.Utf8,
-                "description": pl.Utf8,
-                "reference": pl.Utf8,
-            },
-        )
-
-    # Generate dates (within a reasonable range)
-    dates = draw(
-        st.lists(
-            st.dates(
-                min_value=date(2020, 1, 1),
-                max_value=date(2025, 12, 31),
-            ),
-            min_size=size,
-            max_size=size,
-        )
-    )
-
-    # Generate account strings (1-20 chars)
-    accounts = draw(
-        st.lists(
-            st.text(
-                alphabet=st.characters(
-                    whitelist_categories=("Lu", "Ll", "Nd"),
-                    whitelist_characters="-_",
-                ),
-                min_size=1,
-                max_size=20,
-            ),
-            min_size=size,
-            max_size=size,
-        )
-    )
-
-    # Generate Decimal amounts (2 decimal places, no NaN/infinity)
-    amounts = draw(
-        st.lists(
-            st.decimals(
-                min_value=PyDecimal("-999999999.99"),
-                max_value=PyDecimal("999999999.99"),
-                allow_nan=False,
-                allow_infinity=False,
-                places=2,
-            ),
-            min_size=size,
-            max_size=size,
-        )
-    )
-
-    # Generate currency codes
-    currencies = draw(
-        st.lists(
-            st.sampled_from(["USD", "EUR", "GBP", "JPY"]),
-            min_size=size,
-            max_size=size,
+        # Return a clone of the shared empty IR DataFrame
+        return _EMPTY_IR_DF.clone()
+
+    # Draw every column in one call; each list holds the values of one IR column
+    columns = draw(
+        st.tuples(
+            *(
+                st.lists(element, min_size=size, max_size=size)
+                for element in _IR_COLUMN_ELEMENTS
+            )
         )
     )
 
-    # Generate optional descriptions
-    descriptions = draw(
-        st.lists(
-            st.one_of(
-                st.none(),
-                st.text(
-                    alphabet=st.characters(
-                        whitelist_categories=("Lu", "Ll", "Nd", "Zs"),
-                        whitelist_characters=".,;:-_",
-                    ),
-                    max_size=100,
-                ),
-            ),
-            min_size=size,
-            max_size=size,
-        )
-    )
-
-    # Generate optional references
-    references = draw(
-        st.lists(
-            st.one_of(
-                st.none(),
-                st.text(
-                    alphabet=st.characters(
-                        whitelist_categories=("Lu", "Ll", "Nd"),
-                        whitelist_characters="-_",
-                    ),
-                    max_size=50,
-                ),
-            ),
-            min_size=size,
-            max_size=size,
-        )
-    )
-
-    # Create DataFrame with proper Decimal type casting
-    df = pl.DataFrame(
-        {
-            "date": dates,
-            "account": accounts,
-            "amount": amounts,
-            "currency": currencies,
-            "description": descriptions,
-            "reference": references,
-        }
+    # Build the DataFrame column-wise with the final dtypes, so no cast pass is needed
+    return pl.DataFrame(
+        dict(zip(_IR_TEST_SCHEMA, columns, strict=True)), schema=_IR_TEST_SCHEMA
     )
 
-    # Cast amount column to Decimal type
-    df = df.with_columns(pl.col("amount").cast(pl.Decimal(precision=38, scale=10)))
 
-    return df
+# Schema violations applied by invalid_ir_dataframe to an otherwise valid frame
+_INVALID_IR_MUTATORS = {
+    # Missing required fields
+    "missing_date": lambda df: df.drop("date"),
+    "missing_account": lambda df: df.drop("account"),
+    "missing_amount": lambda df: df.drop("amount"),
+    "missing_currency": lambda df: df.drop("currency"),
+    # Date as ISO string instead of Date
+    "wrong_type_date": lambda df: df.with_columns(pl.col("date").cast(pl.Utf8)),
+    # Amount as Float64 instead of Decimal
+    "wrong_type_amount": lambda df: df.with_columns(pl.col("amount").cast(pl.Float64)),
+    # Extra field not in the IR schema
+    "unexpected_field": lambda df: df.with_columns(pl.lit("extra").alias("unexpected_field")),
+}
 
 
 @composite
@@ -179,23 +185,8 @@ def invalid_ir_dataframe(draw: st.DrawFn) -> pl.DataFrame:
         ...     with pytest.raises(ValidationError):
         ...         validate_ir(df)
     """
-    from datetime import date
-    from decimal import Decimal as PyDecimal
-
     # Choose what kind of invalid DataFrame to generate
-    invalid_type = draw(
-        st.sampled_from(
-            [
-                "missing_date",
-                "missing_account",
-                "missing_amount",
-                "missing_currency",
-                "wrong_type_date",
-                "wrong_type_amount",
-                "unexpected_field",
-            ]
-        )
-    )
+    invalid_type = draw(st.sampled_from(list(_INVALID_IR_MUTATORS)))
 
     # Generate a small size for invalid DataFrames
     size = draw(st.integers(min_value=1, max_value=5))
@@ -223,13 +214,7 @@ def invalid_ir_dataframe(draw: st.DrawFn) -> pl.DataFrame:
     )
     amounts = draw(
         st.lists(
-            st.decimals(
-                min_value=PyDecimal("-999999.99"),
-                max_value=PyDecimal("999999.99"),
-                allow_nan=False,
-                allow_infinity=False,
-                places=2,
-            ),
+            st.integers(min_value=-99_999_999, max_value=99_999_999).map(_cents_to_decimal),
             min_size=size,
             max_size=size,
         )
@@ -238,82 +223,14 @@ def invalid_ir_dataframe(draw: st.DrawFn) -> pl.DataFrame:
         st.lists(st.sampled_from(["USD", "EUR", "GBP"]), min_size=size, max_size=size)
     )
 
-    # Create invalid DataFrame based on type
-    if invalid_type == "missing_date":
-        # Missing date field
-        return pl.DataFrame(
-            {
-                "account": accounts,
-                "amount": amounts,
-                "currency": currencies,
-            }
-        ).with_columns(pl.col("amount").cast(pl.Decimal(precision=38, scale=10)))
-
-    elif invalid_type == "missing_account":
-        # Missing account field
-        return pl.DataFrame(
-            {
-                "date": dates,
-                "amount": amounts,
-                "currency": currencies,
-            }
-        ).with_columns(pl.col("amount").cast(pl.Decimal(precision=38, scale=10)))
-
-    elif invalid_type == "missing_amount":
-        # Missing amount field
-        return pl.DataFrame(
-            {
-                "date": dates,
-                "account": accounts,
-                "currency": currencies,
-            }
-        )
-
-    elif invalid_type == "missing_currency":
-        # Missing currency field
-        return pl.DataFrame(
-            {
-                "date": dates,
-                "account": accounts,
-                "amount": amounts,
-            }
-        ).with_columns(pl.col("amount").cast(pl.Decimal(precision=38, scale=10)))
-
-    elif invalid_type == "wrong_type_date":
-        # Date field has wrong type (string instead of Date)
-        date_strings = [d.isoformat() for d in dates]
-        return pl.DataFrame(
-            {
-                "date": date_strings,  # String instead of Date
-                "account": accounts,
-                "amount": amounts,
-                "currency": currencies,
-            }
-        ).with_columns(pl.col("amount").cast(pl.Decimal(precision=38, scale=10)))
-
-    elif invalid_type == "wrong_type_amount":
-        # Amount field has wrong type (Float64 instead of Decimal)
-        float_amounts = [float(a) for a in amounts]
-        return pl.DataFrame(
-            {
-                "date": dates,
-                "account": accounts,
-                "amount": float_amounts,  # Float64 instead of Decimal
-                "currency": currencies,
-            }
-        )
-
-    elif invalid_type == "unexpected_field":
-        # Has an unexpected field not in IR schema
-        return pl.DataFrame(
-            {
-                "date": dates,
-                "account": accounts,
-                "amount": amounts,
-                "currency": currencies,
-                "unexpected_field": ["extra"] * size,  # Not in IR schema
-            }
-        ).with_columns(pl.col("amount").cast(pl.Decimal(precision=38, scale=10)))
-
-    # Fallback (should not reach here)
-    return pl.DataFrame({"account": accounts})
+    # Build the valid base frame once, then apply the schema violation
+    base = pl.DataFrame(
+        {
+            "date": dates,
+            "account": accounts,
+            "amount": amounts,
+            "currency": currencies,
+        },
+        schema_overrides={"amount": IR_DECIMAL},
+    )
+    return _INVALID_IR_MUTATORS[invalid_type](base)
@@ -25,6 +25,7 @@ from .conftest import invalid_ir_dataframe, valid_ir_dataframe
 
 
 # Feature: core-infrastructure, Property 12: Invalid DataFrames Are Rejected Safely
+@pytest.mark.property
 @given(invalid_ir_dataframe())
 @settings(max_examples=100)
 def test_invalid_dataframes_are_rejected(df: pl.DataFrame) -> None:
@@ -55,6 +56,7 @@ def test_invalid_dataframes_are_rejected(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 13: Validation Errors Are Descriptive
+@pytest.mark.property
 @given(invalid_ir_dataframe())
 @settings(max_examples=100)
 def test_validation_errors_are_descriptive(df: pl.DataFrame) -> None:
@@ -101,6 +103,7 @@ def test_validation_errors_are_descriptive(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 1: Validation Rejects Missing Required Fields
+@pytest.mark.property
 @given(invalid_ir_dataframe())
 @settings(max_examples=100)
 def test_validation_rejects_missing_required_fields(df: pl.DataFrame) -> None:
@@ -134,6 +137,7 @@ def test_validation_rejects_missing_required_fields(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 2: Validation Rejects Incorrect Types
+@pytest.mark.property
 @given(invalid_ir_dataframe())
 @settings(max_examples=100)
 def test_validation_rejects_incorrect_types(df: pl.DataFrame) -> None:
@@ -180,6 +184,7 @@ def test_validation_rejects_incorrect_types(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 12: Error Handling Doesn't Crash
+@pytest.mark.property
 @given(invalid_ir_dataframe())
 @settings(max_examples=100)
 def test_error_handling_does_not_crash(df: pl.DataFrame) -> None:
@@ -213,6 +218,7 @@ def test_error_handling_does_not_crash(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 3: Validation Returns Input Unchanged (Valid Case)
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_validation_returns_valid_input_unchanged(df: pl.DataFrame) -> None:
@@ -241,6 +247,7 @@ def test_validation_returns_valid_input_unchanged(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 4: Validation Is Idempotent
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_validation_is_idempotent(df: pl.DataFrame) -> None:
@@ -273,6 +280,7 @@ def test_validation_is_idempotent(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 5: Validation Does Not Mutate Input
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_validation_does_not_mutate_input(df: pl.DataFrame) -> None:
@@ -10,6 +10,14 @@ from fintran.core.exceptions import (
     WriterError,
 )
 
+# Concrete exception types raised by pipeline components
+CUSTOM_EXCEPTIONS = [ValidationError, ReaderError, WriterError, TransformError]
+
+# (exception, expected parent) pairs for the inheritance hierarchy
+INHERITANCE_CASES = [(cls, FintranError) for cls in CUSTOM_EXCEPTIONS] + [
+    (cls, Exception) for cls in [FintranError, *CUSTOM_EXCEPTIONS]
+]
+
 
 class TestFintranError:
     """Test the base FintranError exception."""
@@ -188,34 +196,17 @@ class TestTransformError:
 class TestExceptionInheritance:
     """Test exception inheritance hierarchy."""
 
-    def test_all_inherit_from_fintran_error(self) -> None:
-        """Test that all custom exceptions inherit from FintranError."""
-        assert issubclass(ValidationError, FintranError)
-        assert issubclass(ReaderError, FintranError)
-        assert issubclass(WriterError, FintranError)
-        assert issubclass(TransformError, FintranError)
-
-    def test_all_inherit_from_exception(self) -> None:
-        """Test that all custom exceptions inherit from Exception."""
-        assert issubclass(FintranError, Exception)
-        assert issubclass(ValidationError, Exception)
-        assert issubclass(ReaderError, Exception)
-        assert issubclass(WriterError, Exception)
-        assert issubclass(TransformError, Exception)
-
-    def test_catch_all_with_fintran_error(self) -> None:
+    @pytest.mark.parametrize("cls,parent", INHERITANCE_CASES)
+    def test_inheritance(self, cls: type[Exception], parent: type[Exception]) -> None:
+        """Test that each custom exception inherits from its expected parent."""
+        assert issubclass(cls, parent)
+
+    @pytest.mark.parametrize("cls", CUSTOM_EXCEPTIONS)
+    def test_catch_all_with_fintran_error(self, cls: type[FintranError]) -> None:
         """Test that FintranError can catch all custom exceptions."""
-        exceptions = [
-            ValidationError("test"),
-            ReaderError("test"),
-            WriterError("test"),
-            TransformError("test"),
-        ]
-
-        for exc in exceptions:
-            try:
-                raise exc
-            except FintranError as e:
-                assert isinstance(e, FintranError)
-            else:
-                pytest.fail(f"Failed to catch {type(exc).__name__}")
+        try:
+            raise cls("test")
+        except FintranError as e:
+            assert isinstance(e, FintranError)
+        else:
+            pytest.fail(f"Failed to catch {cls.__name__}")
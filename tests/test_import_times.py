@@ -0,0 +1,48 @@
+"""Import-time budget checks for the CLI.
+
+Every CLI invocation pays the import cost of fintran.cli.commands before any
+work is done, so heavy module-level imports show up directly as startup
+latency. These tests guard against regressions in that cost.
+"""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Generous wall-clock budget per import, measured in a fresh interpreter
+IMPORT_BUDGET_SECONDS = 2.0
+
+
+def measure_import_time(module: str, iterations: int = 3) -> float:
+    """Measure the fastest cold import of a module in a fresh interpreter.
+
+    Args:
+        module: Dotted module name to import
+        iterations: Number of fresh interpreters to start (default: 3)
+
+    Returns:
+        Minimum wall-clock time in seconds, including interpreter startup
+    """
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("module", ["fintran.cli.commands", "fintran.cli.app"])
+def test_cli_import_time_within_budget(module):
+    """Test that importing the CLI stays within the startup budget.
+
+    Args:
+        module: CLI module whose import time is measured
+    """
+    elapsed = measure_import_time(module)
+
+    assert elapsed < IMPORT_BUDGET_SECONDS, (
+        f"Importing {module} took {elapsed:.2f}s, budget is {IMPORT_BUDGET_SECONDS}s"
+    )
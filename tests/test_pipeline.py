@@ -19,8 +19,9 @@ Requirements:
     - Requirement 9.6: Transform_Service wraps errors with step context
 """
 
+from datetime import date
+from decimal import Decimal
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import Any
 
 import polars as pl
@@ -35,6 +36,7 @@ from fintran.core.exceptions import (
 )
 from fintran.core.pipeline import execute_pipeline
 from fintran.core.protocols import Transform
+from tests.conftest import IR_DECIMAL
 
 # Mock implementations for testing
 
@@ -186,12 +188,12 @@ class ImmutableViolatingTransform:
 # Test fixtures
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_ir() -> pl.DataFrame:
-    """Create a sample IR DataFrame for testing."""
-    from datetime import date
-    from decimal import Decimal
+    """Create a sample IR DataFrame for testing.
 
+    Built once per module: tests only read it, and transforms return new frames.
+    """
     return pl.DataFrame(
         {
             "date": [date(2024, 1, 15), date(2024, 1, 16)],
@@ -200,111 +202,118 @@ def sample_ir() -> pl.DataFrame:
             "currency": ["USD", "USD"],
             "description": ["Payment received", "Service fee"],
             "reference": ["INV-001", None],
-        }
-    ).with_columns(pl.col("amount").cast(pl.Decimal(precision=38, scale=10)))
+        },
+        schema_overrides={"amount": IR_DECIMAL},
+    )
 
 
 @pytest.fixture
-def temp_paths() -> Any:
-    """Create temporary file paths for testing."""
-    with (
-        NamedTemporaryFile(suffix=".csv") as input_file,
-        NamedTemporaryFile(suffix=".parquet") as output_file,
-    ):
-        yield Path(input_file.name), Path(output_file.name)
-
-
-# Tests for Reader error propagation
-
-
-def test_reader_error_is_propagated(sample_ir: pl.DataFrame, temp_paths: tuple[Path, Path]) -> None:
-    """Test that ReaderError is re-raised without wrapping.
+def temp_paths(tmp_path: Path) -> tuple[Path, Path]:
+    """Create temporary file paths for testing.
 
-    Validates:
-        - Requirement 6.7: Pipeline propagates errors with context
-        - Requirement 9.6: Transform_Service wraps errors with step context
+    The mock readers and writers never open these paths, so no files are created.
     """
-    input_path, output_path = temp_paths
-
-    # Create a reader that raises ReaderError
-    reader_error = ReaderError(
-        "Failed to parse CSV", file_path=str(input_path), reason="Invalid date format"
-    )
-    reader = FailingReader(reader_error)
-    writer = MockWriter()
-
-    # Execute pipeline and expect ReaderError to be re-raised
-    with pytest.raises(ReaderError) as exc_info:
-        execute_pipeline(
-            reader=reader,
-            writer=writer,
-            input_path=input_path,
-            output_path=output_path,
-        )
-
-    # Verify the error is the same instance (not wrapped)
-    assert exc_info.value is reader_error
-
-
-def test_reader_unexpected_error_is_wrapped(
-    sample_ir: pl.DataFrame, temp_paths: tuple[Path, Path]
+    return tmp_path / "input.csv", tmp_path / "output.parquet"
+
+
+# Tests for error propagation from each pipeline step
+
+# Domain errors are re-raised as-is (no wrapped message); anything else is wrapped
+# in PipelineError with the step's context. path_key names the context entry that
+# must carry the step's file path.
+ERROR_PROPAGATION_CASES = [
+    pytest.param(
+        "read",
+        ReaderError("Failed to parse CSV", file_path="input.csv", reason="Invalid date format"),
+        None,
+        {},
+        None,
+        id="reader-error-propagated",
+    ),
+    pytest.param(
+        "read",
+        ValueError("Unexpected parsing error"),
+        "Pipeline failed at read step",
+        {"step": "read"},
+        "input_path",
+        id="reader-unexpected-error-wrapped",
+    ),
+    pytest.param(
+        "transform",
+        TransformError(
+            "Failed to normalize currency",
+            transform_name="CurrencyNormalizer",
+            reason="Unknown currency code",
+        ),
+        None,
+        {},
+        None,
+        id="transform-error-propagated",
+    ),
+    pytest.param(
+        "transform",
+        RuntimeError("Unexpected transformation error"),
+        "Pipeline failed at transform step 0",
+        {"step": "transform_0", "transform_index": 0, "transform_type": "FailingTransform"},
+        None,
+        id="transform-unexpected-error-wrapped",
+    ),
+    pytest.param(
+        "write",
+        WriterError(
+            "Failed to write Parquet file", output_path="output.parquet", reason="Disk full"
+        ),
+        None,
+        {},
+        None,
+        id="writer-error-propagated",
+    ),
+    pytest.param(
+        "write",
+        OSError("Unexpected write error"),
+        "Pipeline failed at write step",
+        {"step": "write"},
+        "output_path",
+        id="writer-unexpected-error-wrapped",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("step", "error", "wrapped_message", "expected_context", "path_key"),
+    ERROR_PROPAGATION_CASES,
+)
+def test_step_error_propagation(
+    step: str,
+    error: Exception,
+    wrapped_message: str | None,
+    expected_context: dict[str, Any],
+    path_key: str | None,
+    sample_ir: pl.DataFrame,
+    temp_paths: tuple[Path, Path],
 ) -> None:
-    """Test that unexpected errors from Reader are wrapped in PipelineError.
+    """Test that step errors are re-raised as-is or wrapped in PipelineError.
 
     Validates:
         - Requirement 6.7: Pipeline propagates errors with context
         - Requirement 9.6: Transform_Service wraps errors with step context
-    """
-    input_path, output_path = temp_paths
-
-    # Create a reader that raises an unexpected error
-    unexpected_error = ValueError("Unexpected parsing error")
-    reader = FailingReader(unexpected_error)
-    writer = MockWriter()
-
-    # Execute pipeline and expect PipelineError
-    with pytest.raises(PipelineError) as exc_info:
-        execute_pipeline(
-            reader=reader,
-            writer=writer,
-            input_path=input_path,
-            output_path=output_path,
-        )
-
-    # Verify error is wrapped with context
-    error = exc_info.value
-    assert "Pipeline failed at read step" in str(error)
-    assert error.context["step"] == "read"
-    assert error.context["input_path"] == str(input_path)
-    assert error.__cause__ is unexpected_error
-
-
-# Tests for Transform error propagation
-
-
-def test_transform_error_is_propagated(
-    sample_ir: pl.DataFrame, temp_paths: tuple[Path, Path]
-) -> None:
-    """Test that TransformError is re-raised without wrapping.
 
-    Validates:
-        - Requirement 6.7: Pipeline propagates errors with context
-        - Requirement 9.6: Transform_Service wraps errors with step context
+    Args:
+        step: Pipeline step whose component raises the error
+        error: Exception raised by the failing component
+        wrapped_message: Expected PipelineError message, or None if re-raised as-is
+        expected_context: Context entries the PipelineError must carry
+        path_key: Context entry holding the step's file path, if any
     """
     input_path, output_path = temp_paths
 
-    # Create a transform that raises TransformError
-    transform_error = TransformError(
-        "Failed to normalize currency",
-        transform_name="CurrencyNormalizer",
-        reason="Unknown currency code",
-    )
-    reader = MockReader(sample_ir)
-    writer = MockWriter()
-    transforms = [FailingTransform(transform_error)]
+    # Put the failing component at the step under test
+    reader = FailingReader(error) if step == "read" else MockReader(sample_ir)
+    writer = FailingWriter(error) if step == "write" else MockWriter()
+    transforms = [FailingTransform(error)] if step == "transform" else []
+    expected_type = type(error) if wrapped_message is None else PipelineError
 
-    # Execute pipeline and expect TransformError to be re-raised
-    with pytest.raises(TransformError) as exc_info:
+    with pytest.raises(expected_type) as exc_info:
         execute_pipeline(
             reader=reader,
             writer=writer,
@@ -313,44 +322,20 @@ def test_transform_error_is_propagated(
             transforms=transforms,
         )
 
-    # Verify the error is the same instance (not wrapped)
-    assert exc_info.value is transform_error
-
-
-def test_transform_unexpected_error_is_wrapped(
-    sample_ir: pl.DataFrame, temp_paths: tuple[Path, Path]
-) -> None:
-    """Test that unexpected errors from Transform are wrapped in PipelineError.
-
-    Validates:
-        - Requirement 6.7: Pipeline propagates errors with context
-        - Requirement 9.6: Transform_Service wraps errors with step context
-    """
-    input_path, output_path = temp_paths
-
-    # Create a transform that raises an unexpected error
-    unexpected_error = RuntimeError("Unexpected transformation error")
-    reader = MockReader(sample_ir)
-    writer = MockWriter()
-    transforms = [FailingTransform(unexpected_error)]
-
-    # Execute pipeline and expect PipelineError
-    with pytest.raises(PipelineError) as exc_info:
-        execute_pipeline(
-            reader=reader,
-            writer=writer,
-            input_path=input_path,
-            output_path=output_path,
-            transforms=transforms,
-        )
+    if wrapped_message is None:
+        # Verify the error is the same instance (not wrapped)
+        assert exc_info.value is error
+        return
 
     # Verify error is wrapped with context
-    error = exc_info.value
-    assert "Pipeline failed at transform step 0" in str(error)
-    assert error.context["step"] == "transform_0"
-    assert error.context["transform_index"] == 0
-    assert error.context["transform_type"] == "FailingTransform"
-    assert error.__cause__ is unexpected_error
+    wrapped = exc_info.value
+    paths = {"input_path": str(input_path), "output_path": str(output_path)}
+    assert wrapped_message in str(wrapped)
+    for key, value in expected_context.items():
+        assert wrapped.context[key] == value
+    if path_key is not None:
+        assert wrapped.context[path_key] == paths[path_key]
+    assert wrapped.__cause__ is error
 
 
 def test_transform_error_context_includes_index(
@@ -391,71 +376,6 @@ def test_transform_error_context_includes_index(
     assert error.context["transform_type"] == "FailingTransform"
 
 
-# Tests for Writer error propagation
-
-
-def test_writer_error_is_propagated(sample_ir: pl.DataFrame, temp_paths: tuple[Path, Path]) -> None:
-    """Test that WriterError is re-raised without wrapping.
-
-    Validates:
-        - Requirement 6.7: Pipeline propagates errors with context
-        - Requirement 9.6: Transform_Service wraps errors with step context
-    """
-    input_path, output_path = temp_paths
-
-    # Create a writer that raises WriterError
-    writer_error = WriterError(
-        "Failed to write Parquet file", output_path=str(output_path), reason="Disk full"
-    )
-    reader = MockReader(sample_ir)
-    writer = FailingWriter(writer_error)
-
-    # Execute pipeline and expect WriterError to be re-raised
-    with pytest.raises(WriterError) as exc_info:
-        execute_pipeline(
-            reader=reader,
-            writer=writer,
-            input_path=input_path,
-            output_path=output_path,
-        )
-
-    # Verify the error is the same instance (not wrapped)
-    assert exc_info.value is writer_error
-
-
-def test_writer_unexpected_error_is_wrapped(
-    sample_ir: pl.DataFrame, temp_paths: tuple[Path, Path]
-) -> None:
-    """Test that unexpected errors from Writer are wrapped in PipelineError.
-
-    Validates:
-        - Requirement 6.7: Pipeline propagates errors with context
-        - Requirement 9.6: Transform_Service wraps errors with step context
-    """
-    input_path, output_path = temp_paths
-
-    # Create a writer that raises an unexpected error
-    unexpected_error = OSError("Unexpected write error")
-    reader = MockReader(sample_ir)
-    writer = FailingWriter(unexpected_error)
-
-    # Execute pipeline and expect PipelineError
-    with pytest.raises(PipelineError) as exc_info:
-        execute_pipeline(
-            reader=reader,
-            writer=writer,
-            input_path=input_path,
-            output_path=output_path,
-        )
-
-    # Verify error is wrapped with context
-    error = exc_info.value
-    assert "Pipeline failed at write step" in str(error)
-    assert error.context["step"] == "write"
-    assert error.context["output_path"] == str(output_path)
-    assert error.__cause__ is unexpected_error
-
-
 # Tests for validation error handling
 
 
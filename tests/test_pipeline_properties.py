@@ -5,6 +5,7 @@ from tempfile import NamedTemporaryFile
 from typing import Any
 
 import polars as pl
+import pytest
 from hypothesis import given, settings
 
 from fintran.core.pipeline import execute_pipeline
@@ -55,6 +56,7 @@ class MockWriter:
 
 
 # Feature: core-infrastructure, Property 11: Pipeline Identity Without Transforms
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_pipeline_identity_with_no_transforms(df: pl.DataFrame) -> None:
@@ -5,6 +5,7 @@ from decimal import Decimal as PyDecimal
 
 import polars as pl
 import pytest
+from polars.datatypes.classes import DataTypeClass
 
 from fintran.core.exceptions import ValidationError
 from fintran.core.schema import (
@@ -16,6 +17,58 @@ from fintran.core.schema import (
 )
 
 
+# Shared IR frames, built once per module; validation never modifies its input
+@pytest.fixture(scope="module")
+def ir_row_df() -> pl.DataFrame:
+    """Create a single-row valid IR DataFrame."""
+    return pl.DataFrame(
+        {
+            "date": [date(2024, 1, 1)],
+            "account": ["ACC001"],
+            "amount": [PyDecimal("100.50")],
+            "currency": ["USD"],
+            "description": ["Test"],
+            "reference": ["REF001"],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def empty_ir() -> pl.DataFrame:
+    """Create an empty IR DataFrame."""
+    return create_empty_ir()
+
+
+@pytest.fixture(scope="module")
+def ir_schema() -> dict[str, DataTypeClass]:
+    """Return the IR schema definition."""
+    return get_ir_schema()
+
+
+@pytest.fixture(scope="module")
+def missing_currency_df(ir_row_df: pl.DataFrame) -> pl.DataFrame:
+    """Create an IR DataFrame missing the required 'currency' field."""
+    return ir_row_df.drop("currency")
+
+
+@pytest.fixture(scope="module")
+def missing_amount_currency_df(ir_row_df: pl.DataFrame) -> pl.DataFrame:
+    """Create an IR DataFrame missing the required 'amount' and 'currency' fields."""
+    return ir_row_df.drop("amount", "currency")
+
+
+@pytest.fixture(scope="module")
+def wrong_type_amount_df(ir_row_df: pl.DataFrame) -> pl.DataFrame:
+    """Create an IR DataFrame whose amount is Int64 instead of Decimal."""
+    return ir_row_df.with_columns(pl.lit(100, dtype=pl.Int64).alias("amount"))
+
+
+@pytest.fixture(scope="module")
+def extra_field_df(ir_row_df: pl.DataFrame) -> pl.DataFrame:
+    """Create an IR DataFrame with a field that is not in the IR schema."""
+    return ir_row_df.with_columns(pl.lit("unexpected").alias("extra_field"))
+
+
 class TestSchemaDefinition:
     """Tests for IR schema definition functions."""
 
@@ -25,10 +78,9 @@ class TestSchemaDefinition:
         assert len(df) == 0
         assert isinstance(df, pl.DataFrame)
 
-    def test_create_empty_ir_has_correct_schema(self) -> None:
+    def test_create_empty_ir_has_correct_schema(self, empty_ir: pl.DataFrame) -> None:
         """Test that create_empty_ir has all required and optional fields."""
-        df = create_empty_ir()
-        columns = set(df.columns)
+        columns = set(empty_ir.columns)
 
         # Check all required fields are present
         for field in REQUIRED_FIELDS:
@@ -38,10 +90,9 @@ class TestSchemaDefinition:
         for field in OPTIONAL_FIELDS:
             assert field in columns
 
-    def test_create_empty_ir_has_correct_types(self) -> None:
+    def test_create_empty_ir_has_correct_types(self, empty_ir: pl.DataFrame) -> None:
         """Test that create_empty_ir has correct data types."""
-        df = create_empty_ir()
-        schema = df.schema
+        schema = empty_ir.schema
 
         assert schema["date"] == pl.Date
         assert schema["account"] == pl.Utf8
@@ -50,15 +101,13 @@ class TestSchemaDefinition:
         assert schema["description"] == pl.Utf8
         assert schema["reference"] == pl.Utf8
 
-    def test_get_ir_schema_returns_dict(self) -> None:
+    def test_get_ir_schema_returns_dict(self, ir_schema: dict[str, DataTypeClass]) -> None:
         """Test that get_ir_schema returns a dictionary."""
-        schema = get_ir_schema()
-        assert isinstance(schema, dict)
+        assert isinstance(ir_schema, dict)
 
-    def test_get_ir_schema_has_all_fields(self) -> None:
+    def test_get_ir_schema_has_all_fields(self, ir_schema: dict[str, DataTypeClass]) -> None:
         """Test that get_ir_schema includes all required and optional fields."""
-        schema = get_ir_schema()
-        fields = set(schema.keys())
+        fields = set(ir_schema.keys())
 
         for field in REQUIRED_FIELDS:
             assert field in fields
@@ -81,11 +130,10 @@ class TestSchemaDefinition:
 class TestValidation:
     """Tests for IR validation service."""
 
-    def test_validate_empty_ir_succeeds(self) -> None:
+    def test_validate_empty_ir_succeeds(self, empty_ir: pl.DataFrame) -> None:
         """Test that validating an empty IR DataFrame succeeds."""
-        df = create_empty_ir()
-        result = validate_ir(df)
-        assert result is df  # Same reference, not modified
+        result = validate_ir(empty_ir)
+        assert result is empty_ir  # Same reference, not modified
 
     def test_validate_ir_with_data_succeeds(self) -> None:
         """Test that validating an IR DataFrame with data succeeds."""
@@ -117,85 +165,47 @@ class TestValidation:
         result = validate_ir(df)
         assert result is df
 
-    def test_validate_ir_missing_required_field_raises_error(self) -> None:
+    def test_validate_ir_missing_required_field_raises_error(
+        self, missing_currency_df: pl.DataFrame
+    ) -> None:
         """Test that validation fails when a required field is missing."""
-        df = pl.DataFrame(
-            {
-                "date": [date(2024, 1, 1)],
-                "account": ["ACC001"],
-                "amount": [PyDecimal("100.50")],
-                # Missing 'currency' field
-                "description": ["Test"],
-                "reference": ["REF001"],
-            }
-        )
-
         with pytest.raises(ValidationError) as exc_info:
-            validate_ir(df)
+            validate_ir(missing_currency_df)
 
         assert "currency" in str(exc_info.value)
         assert exc_info.value.context["missing_fields"] == ["currency"]
 
-    def test_validate_ir_multiple_missing_fields_raises_error(self) -> None:
+    def test_validate_ir_multiple_missing_fields_raises_error(
+        self, missing_amount_currency_df: pl.DataFrame
+    ) -> None:
         """Test that validation reports all missing required fields."""
-        df = pl.DataFrame(
-            {
-                "date": [date(2024, 1, 1)],
-                "account": ["ACC001"],
-                # Missing 'amount' and 'currency'
-                "description": ["Test"],
-                "reference": ["REF001"],
-            }
-        )
-
         with pytest.raises(ValidationError) as exc_info:
-            validate_ir(df)
+            validate_ir(missing_amount_currency_df)
 
         missing = exc_info.value.context["missing_fields"]
         assert "amount" in missing
         assert "currency" in missing
 
-    def test_validate_ir_incorrect_type_raises_error(self) -> None:
+    def test_validate_ir_incorrect_type_raises_error(
+        self, wrong_type_amount_df: pl.DataFrame
+    ) -> None:
         """Test that validation fails when a field has incorrect type."""
-        df = pl.DataFrame(
-            {
-                "date": [date(2024, 1, 1)],
-                "account": ["ACC001"],
-                "amount": [100],  # Int64 instead of Decimal
-                "currency": ["USD"],
-                "description": ["Test"],
-                "reference": ["REF001"],
-            }
-        )
-
         with pytest.raises(ValidationError) as exc_info:
-            validate_ir(df)
+            validate_ir(wrong_type_amount_df)
 
         assert "amount" in str(exc_info.value)
         assert exc_info.value.context["field"] == "amount"
 
-    def test_validate_ir_unexpected_field_raises_error(self) -> None:
+    def test_validate_ir_unexpected_field_raises_error(self, extra_field_df: pl.DataFrame) -> None:
         """Test that validation fails when unexpected fields are present."""
-        df = pl.DataFrame(
-            {
-                "date": [date(2024, 1, 1)],
-                "account": ["ACC001"],
-                "amount": [PyDecimal("100.50")],
-                "currency": ["USD"],
-                "description": ["Test"],
-                "reference": ["REF001"],
-                "extra_field": ["unexpected"],  # Not in IR schema
-            }
-        )
-
         with pytest.raises(ValidationError) as exc_info:
-            validate_ir(df)
+            validate_ir(extra_field_df)
 
         assert "extra_field" in str(exc_info.value)
 
-    def test_validate_ir_is_idempotent(self) -> None:
+    def test_validate_ir_is_idempotent(self, empty_ir: pl.DataFrame) -> None:
         """Test that validating twice produces the same result."""
-        df = create_empty_ir()
+        df = empty_ir
 
         result1 = validate_ir(df)
         result2 = validate_ir(result1)
@@ -204,18 +214,9 @@ class TestValidation:
         assert result2 is df
         assert result1 is result2
 
-    def test_validate_ir_does_not_modify_input(self) -> None:
+    def test_validate_ir_does_not_modify_input(self, ir_row_df: pl.DataFrame) -> None:
         """Test that validation does not modify the input DataFrame."""
-        df = pl.DataFrame(
-            {
-                "date": [date(2024, 1, 1)],
-                "account": ["ACC001"],
-                "amount": [PyDecimal("100.50")],
-                "currency": ["USD"],
-                "description": ["Test"],
-                "reference": ["REF001"],
-            }
-        )
+        df = ir_row_df
 
         original_id = id(df)
         result = validate_ir(df)
@@ -8,6 +8,7 @@ that hold without knowing exact values.
 """
 
 import polars as pl
+import pytest
 from hypothesis import given, settings
 
 from fintran.core.schema import REQUIRED_FIELDS, validate_ir
@@ -16,6 +17,7 @@ from .conftest import valid_ir_dataframe
 
 
 # Feature: core-infrastructure, Property 14: Schema Has Exactly Four Required Fields
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_schema_has_four_required_fields(df: pl.DataFrame) -> None:
@@ -52,6 +54,7 @@ def test_schema_has_four_required_fields(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 15: Schema Has Between Four and Six Total Fields
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_schema_has_four_to_six_total_fields(df: pl.DataFrame) -> None:
@@ -82,6 +85,7 @@ def test_schema_has_four_to_six_total_fields(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 14 & 15: Combined Schema Structure
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_schema_structure_consistency(df: pl.DataFrame) -> None:
@@ -8,6 +8,7 @@ This is a critical property for reproducibility and debugging.
 """
 
 import polars as pl
+import pytest
 from hypothesis import given, settings
 
 from fintran.core.schema import validate_ir
@@ -77,6 +78,7 @@ class AddDescriptionTransform:
 
 
 # Feature: core-infrastructure, Property 10: Transforms Are Deterministic
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_identity_transform_is_deterministic(df: pl.DataFrame) -> None:
@@ -108,6 +110,7 @@ def test_identity_transform_is_deterministic(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 10: Transforms Are Deterministic (Sort)
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_sort_transform_is_deterministic(df: pl.DataFrame) -> None:
@@ -138,6 +141,7 @@ def test_sort_transform_is_deterministic(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 10: Transforms Are Deterministic (Modification)
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_modification_transform_is_deterministic(df: pl.DataFrame) -> None:
@@ -170,6 +174,7 @@ def test_modification_transform_is_deterministic(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 10: Transforms Are Deterministic (Multiple Invocations)
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_transform_determinism_across_multiple_invocations(df: pl.DataFrame) -> None:
@@ -204,6 +209,7 @@ def test_transform_determinism_across_multiple_invocations(df: pl.DataFrame) ->
 
 
 # Feature: core-infrastructure, Property 10: Transform Determinism with Validation
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_transform_determinism_with_validation(df: pl.DataFrame) -> None:
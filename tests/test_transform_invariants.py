@@ -11,6 +11,7 @@ Invariants tested:
 """
 
 import polars as pl
+import pytest
 from hypothesis import given, settings
 
 from fintran.core.schema import REQUIRED_FIELDS, validate_ir
@@ -68,6 +69,7 @@ class FilterTransform:
 
 
 # Feature: core-infrastructure, Property 7: Transforms Preserve or Reduce Row Count
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_transform_preserves_or_reduces_row_count(df: pl.DataFrame) -> None:
@@ -104,6 +106,7 @@ def test_transform_preserves_or_reduces_row_count(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 7: Transforms Preserve or Reduce Row Count (Filter Case)
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_filter_transform_reduces_row_count(df: pl.DataFrame) -> None:
@@ -139,6 +142,7 @@ def test_filter_transform_reduces_row_count(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 8: Transforms Preserve Required Field Non-Nullness
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_transform_preserves_required_field_non_nullness(df: pl.DataFrame) -> None:
@@ -175,6 +179,7 @@ def test_transform_preserves_required_field_non_nullness(df: pl.DataFrame) -> No
 
 
 # Feature: core-infrastructure, Property 9: Transforms Preserve Valid IR Schema
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_transform_preserves_valid_ir_schema(df: pl.DataFrame) -> None:
@@ -213,6 +218,7 @@ def test_transform_preserves_valid_ir_schema(df: pl.DataFrame) -> None:
 
 
 # Feature: core-infrastructure, Property 7, 8, 9: Combined IR Invariants
+@pytest.mark.property
 @given(valid_ir_dataframe())
 @settings(max_examples=100)
 def test_all_transform_invariants_combined(df: pl.DataFrame) -> None:
@@ -15,7 +15,6 @@ from hypothesis import strategies as st
 from fintran.validation.business.currency import CurrencyConsistencyValidator
 from fintran.validation.result import ValidationResult
 
-
 # Hypothesis strategies for currency consistency testing
 
 @st.composite
@@ -248,6 +247,7 @@ class TestCurrencyConsistencyValidatorProperties:
     Validates Requirements: 4.2, 4.3, 4.4, 4.5, 20.1
     """
     
+    @pytest.mark.property
     @given(ir_with_consistent_currency())
     @settings(max_examples=50, deadline=None)
     def test_property_consistent_currency_passes(self, df: pl.DataFrame):
@@ -263,6 +263,7 @@ class TestCurrencyConsistencyValidatorProperties:
         assert not result.has_errors()
         assert result.validator_name == "CurrencyConsistencyValidator"
     
+    @pytest.mark.property
     @given(ir_with_mixed_currency())
     @settings(max_examples=50, deadline=None)
     def test_property_mixed_currency_fails(self, df: pl.DataFrame):
@@ -286,6 +287,7 @@ class TestCurrencyConsistencyValidatorProperties:
         # Verify metadata contains information about violations
         assert "violations" in result.metadata or "groups_with_violations" in result.metadata
     
+    @pytest.mark.property
     @given(ir_with_single_currency())
     @settings(max_examples=50, deadline=None)
     def test_property_single_currency_whole_dataframe(self, df: pl.DataFrame):
@@ -301,6 +303,7 @@ class TestCurrencyConsistencyValidatorProperties:
         assert result.is_valid, f"Expected validation to pass for single currency DataFrame, but got errors: {result.errors}"
         assert not result.has_errors()
     
+    @pytest.mark.property
     @given(ir_with_consistent_currency())
     @settings(max_examples=50, deadline=None)
     def test_property_determinism(self, df: pl.DataFrame):
@@ -318,6 +321,7 @@ class TestCurrencyConsistencyValidatorProperties:
         assert result1.errors == result2.errors
         assert result1.warnings == result2.warnings
     
+    @pytest.mark.property
     @given(ir_with_mixed_currency())
     @settings(max_examples=50, deadline=None)
     def test_property_immutability(self, df: pl.DataFrame):
@@ -335,6 +339,7 @@ class TestCurrencyConsistencyValidatorProperties:
         # Verify DataFrame was not modified
         assert df.equals(df_copy), "Validator modified the input DataFrame"
     
+    @pytest.mark.property
     @given(ir_with_mixed_currency())
     @settings(max_examples=50, deadline=None)
     def test_property_error_message_completeness(self, df: pl.DataFrame):
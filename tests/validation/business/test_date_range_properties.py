@@ -15,7 +15,6 @@ from hypothesis import strategies as st
 from fintran.validation.business.dates import DateRangeValidator
 from fintran.validation.result import ValidationResult
 
-
 # Hypothesis strategies for date range testing
 
 @st.composite
@@ -198,6 +197,7 @@ class TestDateRangeValidatorProperties:
     Validates Requirements: 5.2, 5.3, 5.4, 5.5, 20.1
     """
     
+    @pytest.mark.property
     @given(ir_with_dates_in_range())
     @settings(max_examples=50, deadline=None)
     def test_property_dates_in_range_pass(self, df: pl.DataFrame):
@@ -217,6 +217,7 @@ class TestDateRangeValidatorProperties:
         assert not result.has_errors()
         assert result.validator_name == "DateRangeValidator"
     
+    @pytest.mark.property
     @given(ir_with_dates_outside_range())
     @settings(max_examples=50, deadline=None)
     def test_property_dates_outside_range_fail(self, df: pl.DataFrame):
@@ -244,6 +245,7 @@ class TestDateRangeValidatorProperties:
         # Verify metadata contains violation details
         assert "violations" in result.metadata or "violation_count" in result.metadata
     
+    @pytest.mark.property
     @given(ir_with_dates_outside_range())
     @settings(max_examples=50, deadline=None)
     def test_property_min_date_only(self, df: pl.DataFrame):
@@ -268,6 +270,7 @@ class TestDateRangeValidatorProperties:
         else:
             assert result.is_valid
     
+    @pytest.mark.property
     @given(ir_with_dates_outside_range())
     @settings(max_examples=50, deadline=None)
     def test_property_max_date_only(self, df: pl.DataFrame):
@@ -292,6 +295,7 @@ class TestDateRangeValidatorProperties:
         else:
             assert result.is_valid
     
+    @pytest.mark.property
     @given(ir_with_dates_in_range())
     @settings(max_examples=50, deadline=None)
     def test_property_determinism(self, df: pl.DataFrame):
@@ -309,6 +313,7 @@ class TestDateRangeValidatorProperties:
         assert result1.errors == result2.errors
         assert result1.warnings == result2.warnings
     
+    @pytest.mark.property
     @given(ir_with_dates_outside_range())
     @settings(max_examples=50, deadline=None)
     def test_property_immutability(self, df: pl.DataFrame):
@@ -326,6 +331,7 @@ class TestDateRangeValidatorProperties:
         # Verify DataFrame was not modified
         assert df.equals(df_copy), "Validator modified the input DataFrame"
     
+    @pytest.mark.property
     @given(ir_with_dates_outside_range())
     @settings(max_examples=50, deadline=None)
     def test_property_error_message_completeness(self, df: pl.DataFrame):
@@ -12,9 +12,9 @@ from hypothesis import strategies as st
 
 from hypothesis import settings
 
-# Configure Hypothesis for validation tests
-settings.register_profile("validation", max_examples=100, deadline=None)
-settings.load_profile("validation")
+# Example budget for validation property tests without their own @settings; every
+# other setting comes from the profile loaded by the root conftest
+VALIDATION_SETTINGS = settings(parent=settings.default, max_examples=100)
 
 
 # Hypothesis strategies for generating test data
@@ -851,3 +851,34 @@ def test_validation_pipeline_with_empty_dataframe():
     assert report.total_validators == 3
     assert report.passed == 3
     assert report.failed == 0
+
+
+def test_validation_pipeline_with_fragmented_dataframe():
+    """Test ValidationPipeline reports original row indices on multi-chunk input.
+    
+    Validates: Requirement 20.2 (edge cases)
+    """
+    chunks = [
+        pl.DataFrame({
+            "date": [date(2024, 1, i)],
+            "account": ["4001"],
+            "amount": [Decimal(amount)],
+            "currency": ["USD"],
+        })
+        for i, amount in enumerate(["100.00", "-5.00", "20.00"], start=1)
+    ]
+    df = pl.concat(chunks, rechunk=False)
+    assert df.n_chunks() > 1
+    
+    validators = [
+        PositiveAmountsValidator(account_patterns=["^4[0-9]{3}"]),
+        CurrencyConsistencyValidator(group_by=["account"]),
+    ]
+    pipeline = ValidationPipeline(validators=validators, mode=ValidationMode.CONTINUE)
+    
+    report = pipeline.run(df)
+    
+    assert report.failed == 1
+    assert report.results[0].metadata["violations"][0]["row_index"] == 1
+    # Input is left untouched
+    assert df.n_chunks() > 1
@@ -14,7 +14,6 @@ from hypothesis import strategies as st
 from fintran.validation.report import ValidationReport, create_report
 from fintran.validation.result import ValidationResult
 
-
 # Hypothesis strategies for ValidationReport testing
 
 
@@ -135,6 +134,7 @@ class TestValidationReportProperties:
     Validates Requirements: 11.2, 11.4, 11.6
     """
     
+    @pytest.mark.property
     @given(validation_report_strategy())
     @settings(max_examples=100, deadline=None)
     def test_property_15_summary_accuracy(self, report: ValidationReport):
@@ -166,6 +166,7 @@ class TestValidationReportProperties:
         assert report.passed + report.failed == report.total_validators, \
             "passed + failed should equal total_validators"
     
+    @pytest.mark.property
     @given(validation_report_strategy())
     @settings(max_examples=100, deadline=None)
     def test_property_16_json_round_trip(self, report: ValidationReport):
@@ -206,6 +207,7 @@ class TestValidationReportProperties:
             assert restored_result.warnings == original.warnings
             assert restored_result.metadata == original.metadata
     
+    @pytest.mark.property
     @given(validation_report_strategy())
     @settings(max_examples=100, deadline=None)
     def test_property_17_filtering_errors(self, report: ValidationReport):
@@ -232,6 +234,7 @@ class TestValidationReportProperties:
                 # (We check by validator name, but it's possible the name appears in error messages)
                 pass  # Difficult to verify absence without false positives
     
+    @pytest.mark.property
     @given(validation_report_strategy())
     @settings(max_examples=100, deadline=None)
     def test_property_17_filtering_warnings(self, report: ValidationReport):
@@ -251,6 +254,7 @@ class TestValidationReportProperties:
             assert result.validator_name in formatted, \
                 f"Validator {result.validator_name} with warnings not in filtered output"
     
+    @pytest.mark.property
     @given(validation_report_strategy())
     @settings(max_examples=100, deadline=None)
     def test_property_17_filtering_all(self, report: ValidationReport):
@@ -267,6 +271,7 @@ class TestValidationReportProperties:
             assert result.validator_name in formatted, \
                 f"Validator {result.validator_name} not in unfiltered output"
     
+    @pytest.mark.property
     @given(st.lists(validation_result_strategy(), min_size=1, max_size=10))
     @settings(max_examples=100, deadline=None)
     def test_property_create_report_accuracy(self, results: list[ValidationResult]):
@@ -21,10 +21,10 @@ from fintran.validation.result import ValidationResult
 from fintran.validation.transform import (
     ValidatingTransform,
     attach_validation_report,
+    fork,
     get_validation_reports,
 )
 
-
 # Mock validators for testing
 
 class AlwaysPassValidator:
@@ -73,6 +73,23 @@ class AlwaysWarnValidator:
         )
 
 
+class ColumnRecordingValidator:
+    """Mock validator that records the columns it was given."""
+    
+    def __init__(self, required_columns: frozenset[str] | None = None):
+        if required_columns is not None:
+            self.required_columns = required_columns
+        self.seen_columns: list[str] = []
+    
+    def validate(self, df: pl.DataFrame) -> ValidationResult:
+        """Record the columns and return success."""
+        self.seen_columns = df.columns
+        return ValidationResult(
+            is_valid=True,
+            validator_name="column_recording",
+        )
+
+
 # Hypothesis strategies
 
 @st.composite
@@ -147,6 +164,7 @@ class TestValidatingTransformProperties:
     Validates Requirements: 12.2, 12.3, 22.1, 22.3
     """
     
+    @pytest.mark.property
     @given(valid_ir_dataframe())
     @settings(max_examples=50, deadline=None)
     def test_property_18_metadata_attachment_pass(self, df: pl.DataFrame):
@@ -184,6 +202,7 @@ class TestValidatingTransformProperties:
         assert report["results"][0]["validator_name"] == "test_validator"
         assert report["results"][0]["is_valid"] is True
     
+    @pytest.mark.property
     @given(valid_ir_dataframe())
     @settings(max_examples=50, deadline=None)
     def test_property_18_metadata_attachment_fail(self, df: pl.DataFrame):
@@ -219,6 +238,7 @@ class TestValidatingTransformProperties:
         assert len(report["results"][0]["errors"]) > 0
         assert "Test error" in report["results"][0]["errors"][0]
     
+    @pytest.mark.property
     @given(valid_ir_dataframe())
     @settings(max_examples=50, deadline=None)
     def test_property_18_metadata_attachment_multiple_validators(self, df: pl.DataFrame):
@@ -257,6 +277,7 @@ class TestValidatingTransformProperties:
         # Verify warnings are captured
         assert report["summary"]["warnings_count"] == 1
     
+    @pytest.mark.property
     @given(valid_ir_dataframe())
     @settings(max_examples=50, deadline=None)
     def test_property_19_fail_fast_raises_error(self, df: pl.DataFrame):
@@ -287,6 +308,7 @@ class TestValidatingTransformProperties:
         assert report.results[0].validator_name == "test_validator"
         assert "Critical error" in report.results[0].errors[0]
     
+    @pytest.mark.property
     @given(valid_ir_dataframe())
     @settings(max_examples=50, deadline=None)
     def test_property_19_fail_fast_passes_when_valid(self, df: pl.DataFrame):
@@ -308,6 +330,7 @@ class TestValidatingTransformProperties:
         assert len(reports) > 0
         assert reports[0]["summary"]["is_valid"] is True
     
+    @pytest.mark.property
     @given(valid_ir_dataframe())
     @settings(max_examples=50, deadline=None)
     def test_property_19_continue_mode_no_error(self, df: pl.DataFrame):
@@ -330,6 +353,7 @@ class TestValidatingTransformProperties:
         assert reports[0]["summary"]["is_valid"] is False
         assert reports[0]["summary"]["failed"] == 1
     
+    @pytest.mark.property
     @given(valid_ir_dataframe())
     @settings(max_examples=50, deadline=None)
     def test_property_metadata_retrieval_consistency(self, df: pl.DataFrame):
@@ -469,6 +493,103 @@ class TestValidatingTransformEdgeCases:
         assert len(reports) == 2
         assert reports[0]["results"][0]["validator_name"] == "validator1"
         assert reports[1]["results"][0]["validator_name"] == "validator2"
+    
+    def test_history_limit_keeps_most_recent_reports(self):
+        """Test that report history is bounded by history_limit, dropping the oldest."""
+        df = pl.DataFrame({
+            "date": [date(2024, 1, 1)],
+            "account": ["ACC1"],
+            "amount": [PyDecimal("100.00")],
+            "currency": ["USD"],
+        })
+        
+        for i in range(5):
+            pipeline = ValidationPipeline([AlwaysPassValidator(f"validator{i}")])
+            df = attach_validation_report(df, pipeline.run(df), history_limit=3)
+        
+        reports = get_validation_reports(df)
+        assert [r["results"][0]["validator_name"] for r in reports] == [
+            "validator2",
+            "validator3",
+            "validator4",
+        ]
+    
+    def test_validators_receive_only_required_columns(self):
+        """Test that the pipeline only sees columns the validators declare."""
+        df = pl.DataFrame({
+            "date": [date(2024, 1, 1)],
+            "account": ["ACC1"],
+            "amount": [PyDecimal("100.00")],
+            "currency": ["USD"],
+        })
+        
+        first = ColumnRecordingValidator(frozenset({"amount"}))
+        second = ColumnRecordingValidator(frozenset({"account", "missing"}))
+        transform = ValidatingTransform(ValidationPipeline([first, second]))
+        
+        result_df = transform.transform(df)
+        
+        assert first.seen_columns == ["account", "amount"]
+        assert second.seen_columns == ["account", "amount"]
+        assert result_df.columns == df.columns
+        assert len(get_validation_reports(result_df)) == 1
+    
+    def test_undeclared_columns_receive_full_dataframe(self):
+        """Test that a validator without required_columns sees every column."""
+        df = pl.DataFrame({
+            "date": [date(2024, 1, 1)],
+            "account": ["ACC1"],
+            "amount": [PyDecimal("100.00")],
+            "currency": ["USD"],
+        })
+        
+        declared = ColumnRecordingValidator(frozenset({"amount"}))
+        undeclared = ColumnRecordingValidator()
+        transform = ValidatingTransform(ValidationPipeline([declared, undeclared]))
+        
+        transform.transform(df)
+        
+        assert undeclared.seen_columns == df.columns
+    
+    def test_input_history_not_mutated(self):
+        """Test that ValidatingTransform leaves the input DataFrame's history untouched."""
+        df = pl.DataFrame({
+            "date": [date(2024, 1, 1)],
+            "account": ["ACC1"],
+            "amount": [PyDecimal("100.00")],
+            "currency": ["USD"],
+        })
+        
+        transform = ValidatingTransform(ValidationPipeline([AlwaysPassValidator()]))
+        result_df = transform.transform(df)
+        
+        assert result_df is not df
+        assert get_validation_reports(df) == []
+        assert len(get_validation_reports(result_df)) == 1
+    
+    def test_fork_copies_history(self):
+        """Test that fork returns a new instance with an independent report history."""
+        df = pl.DataFrame({
+            "date": [date(2024, 1, 1)],
+            "account": ["ACC1"],
+            "amount": [PyDecimal("100.00")],
+            "currency": ["USD"],
+        })
+        report = ValidationPipeline([AlwaysPassValidator()]).run(df)
+        
+        attached = attach_validation_report(df, report)
+        assert attached is not df
+        assert get_validation_reports(df) == []
+        
+        branch = fork(attached)
+        assert branch is not attached
+        assert branch.equals(attached)
+        assert len(get_validation_reports(branch)) == 1
+        
+        extended = attach_validation_report(branch, report)
+        assert len(get_validation_reports(attached)) == 1
+        assert len(get_validation_reports(branch)) == 1
+        assert len(get_validation_reports(extended)) == 2
 
 
 # Configuration tests
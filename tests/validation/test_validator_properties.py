@@ -8,12 +8,19 @@ These properties ensure that validators are pure functions with no side effects.
 """
 
 import polars as pl
+import pytest
 from hypothesis import given
 
-from tests.validation.conftest import valid_ir_dataframe, validator_instances
+from tests.validation.conftest import (
+    VALIDATION_SETTINGS,
+    valid_ir_dataframe,
+    validator_instances,
+)
 
 
+@pytest.mark.property
 @given(validator_instances(), valid_ir_dataframe())
+@VALIDATION_SETTINGS
 def test_validator_determinism(validator, df: pl.DataFrame) -> None:
     """Feature: data-validation-framework, Property 1: Validator Determinism
 
@@ -58,7 +65,9 @@ def test_validator_determinism(validator, df: pl.DataFrame) -> None:
     )
 
 
+@pytest.mark.property
 @given(validator_instances(), valid_ir_dataframe())
+@VALIDATION_SETTINGS
 def test_validator_immutability_reference(validator, df: pl.DataFrame) -> None:
     """Feature: data-validation-framework, Property 24: Validator Immutability (Reference)
 
@@ -87,7 +96,9 @@ def test_validator_immutability_reference(validator, df: pl.DataFrame) -> None:
     )
 
 
+@pytest.mark.property
 @given(validator_instances(), valid_ir_dataframe())
+@VALIDATION_SETTINGS
 def test_validator_immutability_content(validator, df: pl.DataFrame) -> None:
     """Feature: data-validation-framework, Property 24: Validator Immutability (Content)
 